@@ -533,8 +533,9 @@ def executar(
     ),
     provedor: str = typer.Option(
         "pypdf", "--provedor",
-        help="Extrator de texto: pypdf | tesseract | tesseract_modal | "
-             "tesseract_fly | mistral | chandra | unstructured | auto. "
+        help="Extrator de texto: pypdf | pymupdf | tesseract | "
+             "tesseract_modal | tesseract_fly | mistral | chandra | "
+             "unstructured | auto. "
              "Padrão: pypdf (local, gratuito).",
     ),
     forcar: bool = typer.Option(
@@ -1282,8 +1283,9 @@ def re_extrair_cmd(
     ),
     provedor: str = typer.Option(
         "tesseract", "--provedor",
-        help="Provedor de OCR: pypdf | tesseract | tesseract_modal | "
-             "tesseract_fly | mistral | chandra | unstructured.",
+        help="Provedor de OCR: pypdf | pymupdf | tesseract | "
+             "tesseract_modal | tesseract_fly | mistral | chandra | "
+             "unstructured.",
     ),
     forcar: bool = typer.Option(
         False, "--forcar",
@@ -29,6 +29,13 @@ class ScraperConfig:
     driver_max_retries_for_missing: int = 5
     button_wait: float = 10
 
+    # Processos scraped concurrently by `run_scraper_http` (library range
+    # entry point; no CLI caller). `judex varrer-processos` ignores it and
+    # scales with `--shards` instead: one serial process per proxy slice.
+    # Each processo already fans out `_TAB_WORKERS` tab GETs, so keep this
+    # small — STF rate-limits per IP (docs/reports/2026-04-16-D-rate-budget.md).
+    process_workers: int = 1
+
     # Retry Configuration - Driver
     # Budget widened 2026-04-16 after the D-run rate-budget experiments
     # (docs/reports/2026-04-16-D-rate-budget.md): STF's WAF block
@@ -45,6 +52,13 @@ class ScraperConfig:
     document_backoff_min: int = 2
     document_backoff_max: int = 5
 
+    # Ceiling on a downloaded peça body. STF's largest legitimate PDFs
+    # (scanned inteiro teor) run to tens of MB; a link to anything far
+    # past that is a misfiled attachment that would only bloat memory
+    # and peca_cache. Checked against Content-Length before the body is
+    # read, and again as it streams in.
+    peca_max_bytes: int = 200 * 1024 * 1024
+
     # Treat HTTP 403 as a retryable throttle signal. STF's portal issues
     # 403 (not 429) once a sweep trips its WAF rate gate, and the block
     # clears after a few minutes — retrying with exponential backoff rides
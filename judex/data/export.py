@@ -8,29 +8,34 @@ from .output import OutputConfig
 from .types import StfItem
 
 
-def export_item(
-    item: StfItem,
+def export_items(
+    items: list[StfItem],
     out_file: str,
     output_dir: str,
     config: OutputConfig,
-    overwrite: bool = False,
 ) -> set[str]:
+    """Append a batch of items: one DataFrame and one open per format.
+
+    Never truncates: callers that overwrite run `handle_overwrite` once
+    before their first append.
+    """
     exported_files = set[str]()
+    if not items:
+        return exported_files
 
     os.makedirs(output_dir, exist_ok=True)
 
-    handle_overwrite(overwrite, config, out_file)
-
     if config.csv:
-        csv_file = _save_to_csv(item, out_file)
+        csv_file = _save_to_csv(items, out_file)
         exported_files.add(f"CSV: {csv_file}")
 
     if config.jsonl:
-        jsonl_file = _save_to_jsonl(item, out_file)
+        jsonl_file = _save_to_jsonl(items, out_file)
         exported_files.add(f"JSONL: {jsonl_file}")
 
     if config.json:
-        json_file = _save_to_json(item, out_file)
+        for item in items:
+            json_file = _save_to_json(item, out_file)
         exported_files.add(f"JSON: {json_file}")
 
     return exported_files
@@ -59,9 +64,9 @@ def handle_overwrite(overwrite: bool, config: OutputConfig, out_file: str) -> No
                 logging.debug(f"Deleted existing file for overwrite: {json_file}")
 
 
-def _save_to_csv(item: StfItem, out_file: str) -> str:
-    """Save item to CSV file and return the file path."""
-    df = pd.DataFrame([item])
+def _save_to_csv(items: list[StfItem], out_file: str) -> str:
+    """Append items to CSV file and return the file path."""
+    df = pd.DataFrame(items)
 
     # Convert JSON fields to proper JSON strings before saving
     json_columns = [
@@ -97,13 +102,17 @@ def _save_to_csv(item: StfItem, out_file: str) -> str:
     return csv_file
 
 
-def _save_to_jsonl(item: StfItem, out_file: str) -> str:
-    """Save item to JSONL file and return the file path."""
-    df = pd.DataFrame([item])
+def _save_to_jsonl(items: list[StfItem], out_file: str) -> str:
+    """Append items to JSONL file and return the file path.
+
+    Items are already JSON-shaped dicts, so they are dumped directly —
+    no DataFrame round trip — with the same settings as the JSON path.
+    """
     jsonl_file = out_file + ".jsonl"
 
     # Always append to file (or create new if doesn't exist)
-    df.to_json(jsonl_file, orient="records", lines=True, mode="a")
+    with open(jsonl_file, "a", encoding="utf-8") as f:
+        f.writelines(json.dumps(item, ensure_ascii=False) + "\n" for item in items)
     logging.debug(f"Saved to JSONL: {jsonl_file}")
     return jsonl_file
 
@@ -1,6 +1,6 @@
 """Detect which processos are missing from a previous scrape's output.
 
-Reads the CSV/JSONL/JSON file that `export_item` writes, compares the
+Reads the CSV/JSONL/JSON file that `export_items` writes, compares the
 set of processo_id values against the requested range, and returns
 the missing numbers. Backend-neutral: no Selenium, no HTTP.
 """
@@ -47,19 +47,20 @@ def check_missing_processes(
         return []
 
     try:
+        ids: list | pd.Series
         if file_type == "csv":
             df = pd.read_csv(existing_file)
             if "processo_id" not in df.columns:
                 logging.warning("No 'processo_id' column found in CSV file")
                 return []
-            processed_numbers = set(df["processo_id"].astype(str))
+            ids = df["processo_id"]
         elif file_type == "jsonl":
-            processed_numbers = set()
+            ids = []
             with open(existing_file, "r") as f:
                 for line in f:
                     data = json.loads(line.strip())
                     if "processo_id" in data:
-                        processed_numbers.add(str(data["processo_id"]))
+                        ids.append(data["processo_id"])
         else:  # "json"
             with open(existing_file, "r") as f:
                 data = json.load(f)
@@ -67,14 +68,15 @@ def check_missing_processes(
             # Normalize to a list so the comprehension below handles both.
             if isinstance(data, dict):
                 data = [data]
-            processed_numbers = set(
-                str(item["processo_id"])
+            ids = [
+                item["processo_id"]
                 for item in data
                 if isinstance(item, dict) and "processo_id" in item
-            )
+            ]
 
+        processed_numbers = set(str(i) for i in ids)
         expected = set(str(i) for i in range(processo_inicial, processo_final + 1))
-        return [int(num) for num in expected - processed_numbers]
+        return sorted(int(num) for num in expected - processed_numbers)
     except Exception as e:
         logging.error(f"Error checking missing processes: {e}")
         return []
@@ -153,7 +153,11 @@ def make_handlers(
     import json
     from pathlib import Path
     from judex.scraping import scraper as _scraper
-    from judex.scraping.http_session import _http_get_with_retry
+    from judex.config import ScraperConfig
+    from judex.scraping.http_session import (
+        ResponseTooLargeError,
+        _http_get_bytes_with_retry,
+    )
     from judex.scraping.ocr import dispatch as ocr_dispatch
     from judex.scraping.ocr.base import OCRConfig
     from judex.sweeps.peca_classification import filter_substantive
@@ -312,7 +316,17 @@ def make_handlers(
             ]
 
         try:
-            r = _http_get_with_retry(sistemas_holder.session(), url, timeout=60)
+            body = _http_get_bytes_with_retry(
+                sistemas_holder.session(), url,
+                max_bytes=ScraperConfig.peca_max_bytes,
+            )
+        except ResponseTooLargeError as exc:
+            # Terminal: the same link is just as big on every replay.
+            state.record_bytes(
+                task.case_key, url=url, status="oversized", error=str(exc),
+                doc_type=doc_type,
+            )
+            return []
         except Exception as exc:  # noqa: BLE001
             sistemas_holder.report_failure(exc)
             status, msg = _classify_http_exception(exc)
@@ -322,7 +336,7 @@ def make_handlers(
             return []
 
         try:
-            peca_cache.write_bytes(url, r.content)
+            peca_cache.write_bytes(url, body)
         except ValueError as exc:
             # Unsupported magic bytes — treat as terminal.
             state.record_bytes(
@@ -209,7 +209,11 @@ _TERMINAL_OK_STATUSES: frozenset[str] = frozenset({"ok", "skipped_cached"})
 # so operators (and ``--retentar-de``) don't drown in known-empty slots.
 # ``unallocated_pid`` (ADR-0002): STF's portal never bound an incidente
 # for this case-id; re-probing returns the same negative result.
-_TERMINAL_NO_RETRY_STATUSES: frozenset[str] = frozenset({"unallocated_pid"})
+# ``oversized``: the peça body is past ``ScraperConfig.peca_max_bytes``;
+# the link serves the same bytes on every replay.
+_TERMINAL_NO_RETRY_STATUSES: frozenset[str] = frozenset(
+    {"unallocated_pid", "oversized"}
+)
 
 # Combined set: rows whose status falls in either bucket are skipped at
 # errors.jsonl write-time. The two sets are kept distinct so callers
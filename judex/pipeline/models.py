@@ -34,6 +34,7 @@ TaskStatus = Literal[
     "provider_error",
     "no_bytes",
     "empty",
+    "oversized",
     "unallocated_pid",
     "skipped_cached",
 ]
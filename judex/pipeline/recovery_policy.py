@@ -67,6 +67,8 @@ def is_retryable_status(
       the OCR pool on missing input. ``recuperar`` REFETCH_UPSTREAM).
     * ``unallocated_pid`` → False (STF's portal genuinely has no
       incidente bound to the case-id; ADR-0002).
+    * ``oversized`` → False (peça body past ``peca_max_bytes``; the
+      link is just as big on replay).
     * Anything unknown → False (conservative — better to surface in
       the residual report than to churn the WAF on an unmapped
       failure).
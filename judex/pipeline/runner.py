@@ -26,8 +26,6 @@ from collections import Counter as _Counter
 from pathlib import Path
 from typing import Optional
 
-import urllib3
-
 from judex.pipeline.handlers import HandlerFn, make_handlers
 from judex.pipeline.models import Counters, PoolConfig
 from judex.pipeline.scheduler import (
@@ -38,14 +36,6 @@ from judex.pipeline.scheduler import (
 )
 from judex.pipeline.state import PipelineState
 
-# Mirror legacy ``run_sweep.py``: STF serves valid certs but our tests use
-# direct-IP HTTPS with verify=False in some paths. Suppress the urllib3
-# "InsecureRequestWarning" flood so launcher.log stays scannable. The
-# legacy `varrer-processos` / `baixar-pecas` commands do this at module
-# import; the unified pipeline was missing it (the noise drowned out
-# every progress line, surfaced on the first real HC 2020 launch).
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
 HandlersFactory = "Callable[..., dict[str, HandlerFn]]"
 
 
@@ -1,9 +1,11 @@
 """
-Shared helpers used by both the Selenium extractors (src/scraping/extraction/)
-and the HTTP extractors (src/scraping/extraction/http.py).
+Shared helpers used by the fragment extractors re-exported from
+`judex/scraping/extraction/http.py`.
 
 These are pure functions/constants that operate on BeautifulSoup trees
-or raw HTML strings — no driver dependency.
+or raw HTML strings — no driver dependency. Every extractor reads the
+fragment HTML already in hand; none takes a `driver` argument (pinned
+by `tests/unit/test_http_backend_no_selenium.py`).
 """
 
 from __future__ import annotations
@@ -11,7 +13,9 @@ from __future__ import annotations
 import re
 from typing import Iterable, Optional
 
-from bs4 import BeautifulSoup, Tag
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
 
 from judex.utils.text_utils import normalize_spaces
 
@@ -82,25 +86,91 @@ P_DETAIL_SUCCESS = re.compile(r'processo-detalhes bg-font-success">([^<]+)')
 P_GUIA_CELL = re.compile(r'text-right">\s*<span class="processo-detalhes">([^<]+)')
 P_EM_DATE = re.compile(r"em (\d{2}/\d{2}/\d{4})")
 P_RECEBIDO_EM = re.compile(r"Recebido em ([^<]+)")
+P_PETICIONADO_EM = re.compile(r"^Peticionado em\s+")
+_TRAILING_EM_DATE = re.compile(r" em \d{2}/\d{2}/\d{4}$")
+
+
+def processo_dados(soup: BeautifulSoup) -> dict[str, str]:
+    """Map each ``.processo-dados`` label to its value in one pass.
+
+    ``"Relator(a): MIN. FULANO"`` → ``{"Relator(a)": "MIN. FULANO"}``.
+    The label is everything before the first ``:``; the first row wins
+    when a label repeats. Callers look up the label they need instead
+    of re-scanning every div with ``startswith``.
+    """
+    out: dict[str, str] = {}
+    for div in soup.select(".processo-dados"):
+        label, sep, value = div.get_text(" ", strip=True).partition(":")
+        if sep:
+            out.setdefault(label, value.strip())
+    return out
 
 
 def strip_actor_boiler(text: str, prefix: str) -> str:
     """Remove 'Enviado por '/'Recebido por ' prefix and trailing ' em DD/MM/YYYY'."""
-    t = re.sub(rf"^{prefix} ", "", text)
-    t = re.sub(r" em \d{2}/\d{2}/\d{4}$", "", t)
+    t = text.removeprefix(f"{prefix} ")
+    t = _TRAILING_EM_DATE.sub("", t)
     return t.strip()
 
 
-def iter_lista_dados(html: str) -> Iterable[tuple[int, Tag]]:
+_LISTA_DADOS = etree.XPath(
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' lista-dados ')]"
+)
+# lxml.html rejects str input that carries an encoding declaration.
+_XML_DECL = re.compile(r"^\ufeff?\s*<\?xml[^>]*\?>")
+_ASCII_SPACES = " \n\t\x0c\r"
+
+
+def _collapse_blank(text: Optional[str]) -> Optional[str]:
+    # bs4 turns whitespace-only strings into "\n" (or " " with no newline).
+    if text and not text.strip(_ASCII_SPACES):
+        return "\n" if "\n" in text else " "
+    return text
+
+
+def _row_html(row: etree._Element) -> str:
+    """Serialize a row the way bs4's `str(tag)` did.
+
+    bs4 splits `class` on whitespace and re-joins it with single spaces,
+    sorts attributes, and collapses whitespace-only strings; the P_*
+    patterns match literal `class="…">` strings, so all three are
+    reproduced here. Left as lxml writes them: void tags (`<br>` vs
+    `<br/>`) and bare boolean attributes (`disabled` vs `disabled=""`),
+    which no pattern touches.
+    """
+    for el in row.iter():
+        if el is not row:
+            el.tail = _collapse_blank(el.tail)
+        if not isinstance(el.tag, str):  # comment / processing instruction
+            continue
+        el.text = _collapse_blank(el.text)
+        if el.attrib:
+            attrs = sorted(el.attrib.items())
+            el.attrib.clear()
+            for name, value in attrs:
+                el.set(name, " ".join(value.split()) if name == "class" else value)
+    return lxml.html.tostring(row, encoding="unicode", with_tail=False)
+
+
+def iter_lista_dados(html: str) -> Iterable[tuple[int, str]]:
     """
-    Yield (reverse_index, row_tag) for each .lista-dados row in a tab
-    fragment. Reverse index matches the ordering the Selenium extractors
-    produce (newest item gets the highest number).
+    Yield (reverse_index, row_html) for each .lista-dados row in a tab
+    fragment. Newest item gets the highest number.
+
+    Callers only regex over the row markup (the P_* patterns), so this
+    skips the BeautifulSoup tree: raw lxml + one compiled XPath, then
+    each row serialized back to HTML by `_row_html`.
     """
-    soup = BeautifulSoup(html, "lxml")
-    rows = soup.select(".lista-dados")
+    html = _XML_DECL.sub("", html, count=1)
+    if not html.strip():
+        return
+    try:
+        root = lxml.html.fromstring(html)
+    except etree.ParserError:  # comment- or whitespace-only fragment
+        return
+    rows = _LISTA_DADOS(root)
     total = len(rows)
     for i, row in enumerate(rows):
-        yield total - i, row
+        yield total - i, _row_html(row)
 
 
@@ -23,6 +23,15 @@ def extract_incidente(detalhe_soup: BeautifulSoup) -> Optional[int]:
     return None
 
 
+def extract_badge_texts(detalhe_soup: BeautifulSoup) -> list[str]:
+    """Text of every `.badge` pill, in document order.
+
+    Read once per case and handed to `extract_meio` and
+    `extract_publicidade`, which both classify the same pills.
+    """
+    return [b.get_text(strip=True) for b in detalhe_soup.select(".badge")]
+
+
 def extract_badges(detalhe_soup: BeautifulSoup) -> list[str]:
     # Only bg-danger pills are actual flags (Criminal, Medida Liminar, Réu
     # Preso, Maior de 60 anos). bg-primary / bg-success duplicate `meio` /
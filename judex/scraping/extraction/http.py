@@ -25,16 +25,18 @@ a JS template, so orchestration (not just parsing) is needed.
 from __future__ import annotations
 
 from judex.scraping.extraction.classe import extract_classe
-from judex.scraping.extraction.detalhe import extract_badges, extract_incidente
+from judex.scraping.extraction.detalhe import (
+    extract_badge_texts,
+    extract_badges,
+    extract_incidente,
+)
 from judex.scraping.extraction.info import (
-    extract_apensos,
     extract_assuntos,
     extract_data_protocolo,
-    extract_folhas,
     extract_numero_origem,
     extract_orgao_origem,
     extract_origem,
-    extract_volumes,
+    extract_quadros,
 )
 from judex.scraping.extraction.meio import extract_meio
 from judex.scraping.extraction.numero_unico import extract_numero_unico
@@ -58,6 +60,7 @@ __all__ = [
     "extract_numero_unico",
     "extract_classe",
     "extract_relator",
+    "extract_badge_texts",
     "extract_meio",
     "extract_publicidade",
     "extract_badges",
@@ -66,9 +69,7 @@ __all__ = [
     "extract_orgao_origem",
     "extract_origem",
     "extract_numero_origem",
-    "extract_volumes",
-    "extract_folhas",
-    "extract_apensos",
+    "extract_quadros",
     "extract_partes",
     "extract_primeiro_autor",
     "extract_andamentos",
@@ -1,8 +1,8 @@
 """Extractors for the `abaInformacoes` fragment.
 
 All functions take a BeautifulSoup for the tab fragment and return
-either a scalar or a small list. Shares two private helpers
-(`_labeled_value`, `_quadro_value`) used by most extractors.
+either a scalar or a small list (`extract_quadros` returns the three
+counter boxes at once). `_labeled_value` is shared by most extractors.
 """
 
 from __future__ import annotations
@@ -27,21 +27,6 @@ def _labeled_value(soup: BeautifulSoup, label: str) -> Optional[str]:
     return None
 
 
-def _quadro_value(info_soup: BeautifulSoup, label: str) -> Optional[int]:
-    target = label.strip().upper()
-    for box in info_soup.select(".processo-quadro"):
-        rot = box.select_one(".rotulo")
-        if not rot:
-            continue
-        if target in rot.get_text(strip=True).upper():
-            num = box.select_one(".numero")
-            if not num:
-                return None
-            text = num.get_text(strip=True)
-            return int(text) if text.isdigit() else None
-    return None
-
-
 def extract_assuntos(info_soup: BeautifulSoup) -> list[str]:
     wrapper = info_soup.select_one(".informacoes__assunto") or info_soup
     out: list[str] = []
@@ -82,13 +67,32 @@ def extract_numero_origem(info_soup: BeautifulSoup) -> Optional[list[str]]:
     return parts or None
 
 
-def extract_volumes(info_soup: BeautifulSoup) -> Optional[int]:
-    return _quadro_value(info_soup, "VOLUME")
-
+# StfItem field -> substring of the box's upper-cased `.rotulo`.
+_QUADROS: tuple[tuple[str, str], ...] = (
+    ("volumes", "VOLUME"),
+    ("folhas", "FOLHA"),
+    ("apensos", "APENSO"),
+)
 
-def extract_folhas(info_soup: BeautifulSoup) -> Optional[int]:
-    return _quadro_value(info_soup, "FOLHA")
 
+def extract_quadros(info_soup: BeautifulSoup) -> dict[str, Optional[int]]:
+    """Read the volumes/folhas/apensos counter boxes in one pass.
 
-def extract_apensos(info_soup: BeautifulSoup) -> Optional[int]:
-    return _quadro_value(info_soup, "APENSO")
+    The first `.processo-quadro` whose rótulo contains a field's label
+    wins; a box without a numeric `.numero` yields None for that field.
+    """
+    out: dict[str, Optional[int]] = {}
+    for box in info_soup.select(".processo-quadro"):
+        rot = box.select_one(".rotulo")
+        if not rot:
+            continue
+        rotulo = rot.get_text(strip=True).upper()
+        for field, target in _QUADROS:
+            if field in out or target not in rotulo:
+                continue
+            num = box.select_one(".numero")
+            text = num.get_text(strip=True) if num else ""
+            out[field] = int(text) if text.isdigit() else None
+        if len(out) == len(_QUADROS):
+            break
+    return {field: out.get(field) for field, _ in _QUADROS}
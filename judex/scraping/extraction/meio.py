@@ -2,15 +2,12 @@
 Extract meio from process data
 """
 
-from bs4 import BeautifulSoup
-
 from judex.utils.timing import track_extraction_timing
 
 
 @track_extraction_timing
-def extract_meio(soup: BeautifulSoup) -> str | None:
-    """Extract meio from badge elements"""
-    badges = [b.get_text(strip=True) for b in soup.select(".badge")]
+def extract_meio(badges: list[str]) -> str | None:
+    """Extract meio from badge texts (see `extract_badge_texts`)"""
     for badge in badges:
         if "Físico" in badge:
             return "FISICO"
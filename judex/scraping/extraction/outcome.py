@@ -12,11 +12,20 @@ date lives under `data` directly; row index is `index`.
 
 from __future__ import annotations
 
+import re
 from typing import Optional
 
 from judex.analysis.legal_vocab import VERDICT_PATTERNS
 from judex.data.types import OutcomeInfo
 
+# VERDICT_PATTERNS are written lowercase and compiled with re.I. sre's
+# case-insensitive path is ~2x slower than a case-sensitive search, so
+# `_match_verdict` lowers the text once and runs these re.I-free copies
+# (same sources, same order, same first-match-wins).
+_FOLDED_VERDICT_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(pattern.pattern), label) for pattern, label in VERDICT_PATTERNS
+]
+
 
 def derive_outcome(item: dict) -> Optional[OutcomeInfo]:
     """Return {verdict, source, source_index, date_iso} or None.
@@ -53,7 +62,8 @@ def derive_outcome(item: dict) -> Optional[OutcomeInfo]:
 
 
 def _match_verdict(text: str) -> Optional[str]:
-    for pattern, label in VERDICT_PATTERNS:
+    text = text.lower()
+    for pattern, label in _FOLDED_VERDICT_PATTERNS:
         if pattern.search(text):
             return label
     return None
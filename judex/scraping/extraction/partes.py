@@ -24,15 +24,20 @@ def extract_partes(partes_html: str) -> list[dict]:
     # Inside #todas-partes, each .processo-partes row holds one-or-more
     # (label, name) pairs stored as sibling .detalhe-parte + .nome-parte
     # divs. Iterating both lists in parallel reconstructs the pairs.
-    labels = container.select(".detalhe-parte")
-    names = container.select(".nome-parte")
-    out: list[dict] = []
-    for label, name in zip(labels, names):
-        tipo = normalize_spaces(label.get_text(" ", strip=True))
-        nome = normalize_spaces(name.get_text(" ", strip=True))
-        if tipo and nome:
-            out.append({"index": len(out) + 1, "tipo": tipo, "nome": nome})
-    return out
+    # Pairs with an empty side are dropped before numbering, so `index`
+    # stays contiguous.
+    pairs = [
+        (tipo, nome)
+        for label, name in zip(
+            container.select(".detalhe-parte"), container.select(".nome-parte")
+        )
+        if (tipo := normalize_spaces(label.get_text(" ", strip=True)))
+        and (nome := normalize_spaces(name.get_text(" ", strip=True)))
+    ]
+    return [
+        {"index": i, "tipo": tipo, "nome": nome}
+        for i, (tipo, nome) in enumerate(pairs, 1)
+    ]
 
 
 def extract_primeiro_autor(partes: list[dict]) -> Optional[str]:
@@ -2,17 +2,15 @@
 Extract publicidade from process data
 """
 
-from bs4 import BeautifulSoup
-
 from judex.utils.timing import track_extraction_timing
 
 
 @track_extraction_timing
-def extract_publicidade(soup: BeautifulSoup) -> str | None:
-    """Return 'PUBLICO' or 'SIGILOSO' inferred from badges."""
-    badges = [b.get_text(strip=True).upper() for b in soup.select(".badge")]
-    if any("SIGILOSO" in b for b in badges):
+def extract_publicidade(badges: list[str]) -> str | None:
+    """Return 'PUBLICO' or 'SIGILOSO' inferred from badge texts."""
+    upper = [b.upper() for b in badges]
+    if any("SIGILOSO" in b for b in upper):
         return "SIGILOSO"
-    if any("PÚBLICO" in b or "PUBLICO" in b for b in badges):
+    if any("PÚBLICO" in b or "PUBLICO" in b for b in upper):
         return "PUBLICO"
     return None
@@ -4,6 +4,7 @@ Extract relator from process data
 
 from bs4 import BeautifulSoup
 
+from judex.scraping.extraction._shared import processo_dados
 from judex.utils.text_utils import normalize_spaces
 from judex.utils.timing import track_extraction_timing
 
@@ -11,15 +12,14 @@ from judex.utils.timing import track_extraction_timing
 @track_extraction_timing
 def extract_relator(soup: BeautifulSoup) -> str | None:
     """Extract relator from .processo-dados elements"""
-    for div in soup.select(".processo-dados"):
-        text = div.get_text(" ", strip=True)
-        if text.startswith("Relator(a):"):
-            relator = normalize_spaces(text.split(":", 1)[1])
-            # Remove "MIN." prefix if present
-            if relator.startswith("MIN. "):
-                relator = relator[5:]  # Remove "MIN. " (5 characters)
-            # Normalize empty strings to None
-            if not relator:
-                return None
-            return relator
-    return None
+    value = processo_dados(soup).get("Relator(a)")
+    if value is None:
+        return None
+    relator = normalize_spaces(value)
+    # Remove "MIN." prefix if present
+    if relator.startswith("MIN. "):
+        relator = relator[5:]  # Remove "MIN. " (5 characters)
+    # Normalize empty strings to None
+    if not relator:
+        return None
+    return relator
@@ -29,12 +29,12 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 from typing import Any, Callable, Optional
 
 from bs4 import BeautifulSoup
 
 from judex.scraping.extraction._shared import to_iso
+from judex.utils.text_utils import normalize_spaces
 
 # tipoVoto.codigo → vote category in the final `votes` dict.
 # Mirrors what the Selenium extractor ends up collecting from the
@@ -56,14 +56,13 @@ _METADATA_KEYS = (
 )
 
 
-def _normalize_spaces(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
-
-
 def _strip_html(raw: str) -> str:
     # STF's `cabecalho` can be an HTML fragment or plain text with entities;
     # BeautifulSoup handles both (parses tags, resolves &nbsp;/&ccedil;/…).
-    return _normalize_spaces(BeautifulSoup(raw, "lxml").get_text(" ", strip=True))
+    # Neither needs doing without a `<` or `&`, so skip the parse then.
+    if "<" not in raw and "&" not in raw:
+        return normalize_spaces(raw)
+    return normalize_spaces(BeautifulSoup(raw, "lxml").get_text(" ", strip=True))
 
 
 def parse_oi_listing(response: str) -> list[dict]:
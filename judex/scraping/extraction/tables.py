@@ -13,7 +13,6 @@ replaces `index_num`/`id`. `Recurso.tipo` replaces `Recurso.data`.
 
 from __future__ import annotations
 
-import re
 from typing import Optional
 
 from bs4 import BeautifulSoup
@@ -25,6 +24,7 @@ from judex.scraping.extraction._shared import (
     P_DETAIL_SUCCESS,
     P_EM_DATE,
     P_GUIA_CELL,
+    P_PETICIONADO_EM,
     P_RECEBIDO_EM,
     clean_nome,
     iter_lista_dados,
@@ -121,9 +121,7 @@ def extract_pautas(pautas_html: str) -> list[dict]:
 
 def extract_deslocamentos(deslocamentos_html: str) -> list[dict]:
     out: list[dict] = []
-    for index, row in iter_lista_dados(deslocamentos_html):
-        html = str(row)
-
+    for index, html in iter_lista_dados(deslocamentos_html):
         bold = P_DETAIL_BOLD.search(html)
         data_recebido_m = P_DETAIL_SUCCESS.search(html)
         data_enviado_m = P_DETAIL_INFO.search(html)
@@ -189,16 +187,14 @@ def extract_deslocamentos(deslocamentos_html: str) -> list[dict]:
 
 def extract_peticoes(peticoes_html: str) -> list[dict]:
     out: list[dict] = []
-    for index, row in iter_lista_dados(peticoes_html):
-        html = str(row)
-
+    for index, html in iter_lista_dados(peticoes_html):
         data_m = P_DETAIL_BASIC.search(html)
         id_m = P_DETAIL_BOLD.search(html)
         recebido_m = P_RECEBIDO_EM.search(html)
 
         data_raw = normalize_spaces(data_m.group(1)) if data_m else None
         if data_raw:
-            data_raw = re.sub(r"^Peticionado em\s+", "", data_raw)
+            data_raw = P_PETICIONADO_EM.sub("", data_raw)
         petic_id = normalize_spaces(id_m.group(1)) if id_m else None
         recebido = normalize_spaces(recebido_m.group(1)) if recebido_m else None
 
@@ -228,8 +224,8 @@ def extract_recursos(recursos_html: str) -> list[dict]:
     recurso-type label ("AG.REG. NA MEDIDA CAUTELAR NO HABEAS CORPUS"),
     not a date."""
     out: list[dict] = []
-    for index, row in iter_lista_dados(recursos_html):
-        m = P_DETAIL_BOLD.search(str(row))
+    for index, html in iter_lista_dados(recursos_html):
+        m = P_DETAIL_BOLD.search(html)
         tipo = normalize_spaces(m.group(1)) if m else None
         out.append({"index": index, "tipo": tipo})
     return out
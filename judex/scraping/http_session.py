@@ -9,9 +9,11 @@ This module centralises:
 - ``new_session()``   — a `requests.Session` preconfigured with a
   browser-shaped ``User-Agent`` (non-browser UAs like ``curl/*`` get
   permanent 403s) and ``verify=False`` for WSL sandboxes that lack a
-  full CA bundle. The site is public so no secrets travel here.
+  full CA bundle. The site is public so no secrets travel here; the
+  resulting ``InsecureRequestWarning`` is filtered for STF hosts only.
 
-- ``_http_get_with_retry()`` — every outbound GET goes through this.
+- ``_http_get_with_retry()`` — every outbound GET goes through this
+  (``_http_get_bytes_with_retry()`` for peça bodies, size-capped).
   Tenacity retries 429 + 5xx + connection errors; 403 retry is opt-in
   via ``cfg.retry_403`` (the WAF block lifts within minutes). Wires
   ``cfg.throttle.wait/record`` for adaptive per-host pacing and
@@ -29,18 +31,22 @@ the 600-line ceiling (CLAUDE.md § Conventions).
 
 from __future__ import annotations
 
+import functools
 import logging
 import time
+import warnings
 from typing import Optional
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
-    retry,
+    Retrying,
     retry_if_exception,
     stop_after_attempt,
     wait_exponential,
 )
+from urllib3.exceptions import InsecureRequestWarning
 
 from judex.config import ScraperConfig
 
@@ -50,6 +56,26 @@ DEFAULT_UA = (
 )
 
 
+# Keep-alive connections held per host. requests defaults to 10, but one
+# session serves `_TAB_WORKERS` threads (plus sessão and DJe GETs), times
+# `process_workers` under `run_scraper_http`; past the pool size urllib3
+# drops the connection after each response and the next GET pays a fresh
+# TLS handshake.
+_POOL_MAXSIZE = 32
+
+
+# `new_session` turns certificate verification off, and urllib3 warns on
+# every such request — enough to drown sweep progress lines. Silence it
+# for *.stf.jus.br only; an unverified request to any other host still
+# warns.
+_STF_UNVERIFIED_WARNING = (
+    r"Unverified HTTPS request is being made to host '([^']+\.)?stf\.jus\.br'"
+)
+warnings.filterwarnings(
+    "ignore", message=_STF_UNVERIFIED_WARNING, category=InsecureRequestWarning
+)
+
+
 def new_session(proxy: Optional[str] = None) -> requests.Session:
     """Build a `requests.Session` preconfigured for STF.
 
@@ -61,6 +87,10 @@ def new_session(proxy: Optional[str] = None) -> requests.Session:
     Wall taxonomy.
     """
     s = requests.Session()
+    # Retries stay in `_http_get_with_retry`; the adapter only pools.
+    adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     s.headers.update({"User-Agent": DEFAULT_UA})
     s.verify = False  # WSL sandbox lacks full CA bundle; site is public anyway
     if proxy:
@@ -77,6 +107,15 @@ class RetryableHTTPError(Exception):
         super().__init__(f"HTTP {status_code} {url}".rstrip())
 
 
+class ResponseTooLargeError(Exception):
+    """Raised when a body exceeds the caller's ``max_bytes``. Not retried."""
+
+    def __init__(self, max_bytes: int, url: str = "") -> None:
+        self.max_bytes = max_bytes
+        self.url = url
+        super().__init__(f"body exceeds {max_bytes:,} bytes {url}".rstrip())
+
+
 _RETRYABLE_NETWORK_EXCS = (
     requests.ConnectionError,
     requests.Timeout,
@@ -87,43 +126,77 @@ def _should_retry(exc: BaseException) -> bool:
     return isinstance(exc, (RetryableHTTPError,) + _RETRYABLE_NETWORK_EXCS)
 
 
-def _http_get_with_retry(
-    session: requests.Session,
-    url: str,
-    *,
-    params: Optional[dict] = None,
-    headers: Optional[dict] = None,
-    timeout: int = 30,
-    allow_redirects: bool = True,
-    config: Optional[ScraperConfig] = None,
-) -> requests.Response:
-    """GET with tenacity retries on 429, 5xx, and network errors.
+@functools.lru_cache(maxsize=8)
+def _retry_policy(
+    max_retries: int, multiplier: float, backoff_min: float, backoff_max: float
+) -> Retrying:
+    """Tenacity policy for one backoff config, built once per distinct config.
 
-    4xx responses other than 429 raise immediately (no retry) — they signal
-    a client-side problem that won't resolve on its own.
+    Tenacity keeps per-run attempt state on the `Retrying` instance, so
+    callers run a `.copy()` of it, never the cached object itself.
     """
-    cfg = config or ScraperConfig()
-
-    @retry(
-        stop=stop_after_attempt(cfg.driver_max_retries),
+    return Retrying(
+        stop=stop_after_attempt(max_retries),
         wait=wait_exponential(
-            multiplier=cfg.driver_backoff_multiplier,
-            min=cfg.driver_backoff_min,
-            max=cfg.driver_backoff_max,
+            multiplier=multiplier, min=backoff_min, max=backoff_max
         ),
         retry=retry_if_exception(_should_retry),
         reraise=True,
         before_sleep=lambda st: logging.debug(
-            f"Retry {st.attempt_number}/{cfg.driver_max_retries} for GET {url}: "
+            f"Retry {st.attempt_number}/{max_retries} for GET {st.args[0]}: "
             f"{st.outcome.exception()}"
         ),
     )
-    def _go() -> requests.Response:
+
+
+def _read_capped(r: requests.Response, max_bytes: int) -> Optional[bytes]:
+    """Read a streamed body, or return None (connection closed) past ``max_bytes``.
+
+    A declared ``Content-Length`` over the cap aborts before any body
+    bytes are read; otherwise the stream is cut as soon as the running
+    total passes it.
+    """
+    declared = r.headers.get("Content-Length", "")
+    if declared.isdigit() and int(declared) > max_bytes:
+        r.close()
+        return None
+    chunks: list[bytes] = []
+    total = 0
+    for chunk in r.iter_content(chunk_size=1 << 16):
+        total += len(chunk)
+        if total > max_bytes:
+            r.close()
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _get_with_retry(
+    session: requests.Session,
+    url: str,
+    *,
+    params: Optional[dict],
+    headers: Optional[dict],
+    timeout: float | tuple[float, float],
+    allow_redirects: bool,
+    max_bytes: Optional[int],
+    config: Optional[ScraperConfig],
+) -> tuple[requests.Response, Optional[bytes]]:
+    """Shared core of the two GET helpers below.
+
+    With ``max_bytes`` the body is streamed through ``_read_capped`` and
+    returned alongside the response; without it the body is left on
+    ``r.content`` and the second element is None.
+    """
+    cfg = config or ScraperConfig()
+
+    def _go(url: str) -> tuple[requests.Response, Optional[bytes]]:
         host = urlparse(url).hostname or ""
         if cfg.throttle is not None:
             cfg.throttle.wait(host)
 
         started = time.perf_counter()
+        body: Optional[bytes] = None
         try:
             r = session.get(
                 url,
@@ -131,7 +204,10 @@ def _http_get_with_retry(
                 headers=headers,
                 timeout=timeout,
                 allow_redirects=allow_redirects,
+                stream=max_bytes is not None,
             )
+            if max_bytes is not None:
+                body = _read_capped(r, max_bytes)
         except Exception:
             elapsed = time.perf_counter() - started
             if cfg.throttle is not None:
@@ -148,11 +224,15 @@ def _http_get_with_retry(
         if cfg.throttle is not None:
             cfg.throttle.record(host, elapsed, was_error=is_error)
         if cfg.request_log is not None:
+            if max_bytes is None:
+                n_bytes = len(r.content) if r.content is not None else None
+            else:
+                n_bytes = len(body) if body is not None else None
             cfg.request_log.log(
                 url=url,
                 status=r.status_code,
                 elapsed_ms=int(elapsed * 1000),
-                bytes=len(r.content) if r.content is not None else None,
+                bytes=n_bytes,
             )
 
         if (
@@ -162,9 +242,63 @@ def _http_get_with_retry(
         ):
             raise RetryableHTTPError(r.status_code, url)
         r.raise_for_status()  # non-429 4xx: don't retry
-        return r
+        if max_bytes is not None and body is None:
+            raise ResponseTooLargeError(max_bytes, url)
+        return r, body
+
+    policy = _retry_policy(
+        cfg.driver_max_retries,
+        cfg.driver_backoff_multiplier,
+        cfg.driver_backoff_min,
+        cfg.driver_backoff_max,
+    )
+    return policy.copy()(_go, url)
+
+
+def _http_get_with_retry(
+    session: requests.Session,
+    url: str,
+    *,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    timeout: float | tuple[float, float] = 30,
+    allow_redirects: bool = True,
+    config: Optional[ScraperConfig] = None,
+) -> requests.Response:
+    """GET with tenacity retries on 429, 5xx, and network errors.
+
+    4xx responses other than 429 raise immediately (no retry) — they signal
+    a client-side problem that won't resolve on its own.
+    """
+    r, _ = _get_with_retry(
+        session, url, params=params, headers=headers, timeout=timeout,
+        allow_redirects=allow_redirects, max_bytes=None, config=config,
+    )
+    return r
 
-    return _go()
+
+def _http_get_bytes_with_retry(
+    session: requests.Session,
+    url: str,
+    *,
+    max_bytes: int,
+    timeout: float | tuple[float, float] = (10, 60),
+    config: Optional[ScraperConfig] = None,
+) -> bytes:
+    """`_http_get_with_retry` for document bodies: returns the bytes, capped.
+
+    The body is streamed; past ``max_bytes`` the connection is dropped
+    and ``ResponseTooLargeError`` raised (not retried), so an oversized
+    link never sits whole in memory. The default (connect, read) timeout
+    fails a dead host in 10 s while leaving slow multi-MB bodies the
+    full read budget.
+    """
+    _, body = _get_with_retry(
+        session, url, params=None, headers=None, timeout=timeout,
+        allow_redirects=True, max_bytes=max_bytes, config=config,
+    )
+    assert body is not None  # _get_with_retry raised past the cap
+    return body
 
 
 def _decode(r: requests.Response) -> str:
@@ -33,6 +33,7 @@ from judex.scraping.ocr import chandra_runpod as _chandra_runpod
 from judex.scraping.ocr import gemini as _gemini
 from judex.scraping.ocr import mistral as _mistral
 from judex.scraping.ocr import paddle as _paddle
+from judex.scraping.ocr import pymupdf as _pymupdf
 from judex.scraping.ocr import pypdf as _pypdf
 from judex.scraping.ocr import surya as _surya
 from judex.scraping.ocr import tesseract as _tesseract
@@ -44,6 +45,7 @@ from judex.scraping.ocr.base import ExtractResult, OCRConfig, ProviderSpec
 
 _PROVIDERS: list[ProviderSpec] = [
     _pypdf.SPEC,
+    _pymupdf.SPEC,
     _unstructured.SPEC,
     _mistral.SPEC,
     _chandra.SPEC,
@@ -209,12 +211,12 @@ def cheapest_provider(*, batch_ok: bool = True) -> str:
 
     Compares per-page cost at the spec's preferred config (batch when
     ``batch_ok`` and the provider supports it; sync otherwise). Excludes
-    ``pypdf`` since it returns text-layer parses, not OCR. Doesn't
+    ``pypdf``/``pymupdf`` since they return text-layer parses, not OCR. Doesn't
     account for quality, latency, or feature differences.
     """
     candidates: list[tuple[str, float]] = []
     for spec in _PROVIDERS:
-        if spec.name == "pypdf":
+        if spec.name in ("pypdf", "pymupdf"):
             continue
         config = OCRConfig(
             provider=spec.name,
@@ -0,0 +1,52 @@
+"""Local PyMuPDF text-layer extraction, surfaced as an OCR provider.
+
+Same job as the ``pypdf`` provider — read the text layer the PDF
+generator embedded, no OCR — but the page walk and text decode run in
+MuPDF's C engine instead of pure Python. On a 104-page, 24 MB report
+PDF pypdf took ~27 s where PyMuPDF took ~1 s for the same ~156k chars.
+Scans and image-only PDFs come back empty here too; the escalation path
+to a real OCR provider is unchanged.
+
+PyMuPDF is in the ``ocr-local`` extra (``uv sync --extra ocr-local``),
+so the import is deferred to call time like the tesseract provider's.
+"""
+
+from __future__ import annotations
+
+from judex.scraping.ocr.base import ExtractResult, OCRConfig, ProviderSpec
+
+
+def extract(pdf_bytes: bytes, *, config: OCRConfig) -> ExtractResult:
+    import pymupdf
+
+    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+        pages_text = [t for page in doc if (t := page.get_text())]
+        n_pages = doc.page_count
+    text = "\n".join(pages_text).strip()
+    return ExtractResult(
+        text=text,
+        elements=None,
+        pages_processed=n_pages,
+        provider="pymupdf",
+    )
+
+
+def cost(n_pages: int, config: OCRConfig) -> float:
+    # Local text-layer parse — zero API cost.
+    return 0.0
+
+
+def wall(n_pdfs: int, config: OCRConfig) -> float:
+    # ~0.01 s / pdf: pypdf's 0.1 s bakeoff anchor scaled by the ~9×
+    # measured on an 8-page text PDF (23 ms vs 198 ms per document).
+    return n_pdfs * 0.01
+
+
+SPEC = ProviderSpec(
+    name="pymupdf",
+    extract=extract,
+    cost=cost,
+    wall=wall,
+    env_var="",
+    supports_batch=False,
+)
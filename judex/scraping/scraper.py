@@ -90,9 +90,14 @@ class ProcessFetch:
 
 @dataclass
 class _CacheBuf:
-    """Accumulator for one case's tab HTML. Flushed once per case."""
+    """Accumulator for one case's tab HTML. Flushed once per case.
+
+    `cached` holds the archive as read at the start of the case, so each
+    tab lookup is a dict hit rather than another tar.gz inflate.
+    """
 
     tabs: dict[str, str] = field(default_factory=dict)
+    cached: dict[str, str] = field(default_factory=dict)
     dirty: bool = False
 
     def put(self, tab: str, html: str, *, from_network: bool) -> None:
@@ -118,6 +123,9 @@ class NoIncidenteError(Exception):
         )
 
 
+_INCIDENTE_IN_LOCATION = re.compile(r"incidente=(\d+)")
+
+
 def resolve_incidente(
     session: requests.Session,
     classe: str,
@@ -138,7 +146,7 @@ def resolve_incidente(
         config=config,
     )
     loc = r.headers.get("Location", "")
-    m = re.search(r"incidente=(\d+)", loc)
+    m = _INCIDENTE_IN_LOCATION.search(loc)
     if not m:
         # Downgraded from WARNING to DEBUG: ~7% of HC PIDs are unallocated
         # (legitimate STF-side gaps). The downstream caller marks them as
@@ -167,6 +175,18 @@ def fetch_detalhe(
     return _decode(r)
 
 
+# Static parts of every `fetch_tab` request, built once at import rather
+# than re-assembled for each of the ~9 tab GETs every process makes.
+_TAB_EXTRA_PARAMS: dict[str, dict[str, str]] = {
+    TAB_ANDAMENTOS: {"imprimir": ""},
+    TAB_SESSAO: {"tema": ""},
+}
+_XHR_HEADERS: dict[str, str] = {
+    "X-Requested-With": "XMLHttpRequest",
+    "Accept": "text/html, */*; q=0.01",
+}
+
+
 def fetch_tab(
     session: requests.Session,
     incidente: int,
@@ -174,21 +194,11 @@ def fetch_tab(
     *,
     config: Optional[ScraperConfig] = None,
 ) -> str:
-    params: dict = {"incidente": incidente}
-    if tab == TAB_ANDAMENTOS:
-        params["imprimir"] = ""
-    elif tab == TAB_SESSAO:
-        params["tema"] = ""
-    headers = {
-        "X-Requested-With": "XMLHttpRequest",
-        "Referer": f"{BASE}/detalhe.asp?incidente={incidente}",
-        "Accept": "text/html, */*; q=0.01",
-    }
     r = _http_get_with_retry(
         session,
         f"{BASE}/{tab}.asp",
-        params=params,
-        headers=headers,
+        params={"incidente": incidente, **_TAB_EXTRA_PARAMS.get(tab, {})},
+        headers={**_XHR_HEADERS, "Referer": _canonical_url(incidente)},
         config=config,
     )
     return _decode(r)
@@ -213,16 +223,16 @@ def fetch_process(
         session = new_session()
 
     try:
-        incidente: Optional[int] = (
-            html_cache.read_incidente(classe, processo) if use_cache else None
-        )
+        incidente: Optional[int] = None
+        if use_cache:
+            incidente, cache_buf.cached = html_cache.read_case(classe, processo)
         if incidente is None:
             incidente = resolve_incidente(session, classe, processo, config=config)
             cache_buf.dirty = True
 
         def cached(tab: str, fetcher: Any) -> str:
             if use_cache:
-                hit = html_cache.read(classe, processo, tab)
+                hit = cache_buf.cached.get(tab)
                 if hit is not None:
                     cache_buf.put(tab, hit, from_network=False)
                     return hit
@@ -251,134 +261,6 @@ def fetch_process(
             session.close()
 
 
-def run_scraper_http(
-    classe: str,
-    processo_inicial: int,
-    processo_final: int,
-    output_format: str,
-    output_dir: str,
-    overwrite: bool,
-    config: ScraperConfig,
-    fetch_dje: bool = True,
-) -> None:
-    """HTTP-backed equivalent of src.scraping.scraper.run_scraper.
-
-    Shares the output path and missing-retry shape; swaps the per-process
-    Selenium drive for fetch_process + parse under a shared session.
-    """
-    from judex.data.export import export_item
-    from judex.data.missing import check_missing_processes
-    from judex.data.output import OutputConfig
-    from judex.utils.timing import ProcessTimer
-
-    out_file = f"{output_dir}/judex-mini_{classe}_{processo_inicial}-{processo_final}"
-    output_config = OutputConfig.from_format_string(output_format)
-    timer = ProcessTimer()
-    all_exported_files: list[str] = []
-
-    try:
-        with new_session() as session:
-            processos = list(range(processo_inicial, processo_final + 1))
-            all_exported_files.extend(
-                _scrape_http_batch(
-                    processos,
-                    classe,
-                    config,
-                    session,
-                    out_file,
-                    output_dir,
-                    output_config,
-                    overwrite,
-                    timer,
-                    export_item,
-                    fetch_dje=fetch_dje,
-                )
-            )
-
-            for attempt in range(config.driver_max_retries_for_missing):
-                missing = check_missing_processes(
-                    classe,
-                    processo_inicial,
-                    processo_final,
-                    output_dir,
-                    output_config,
-                )
-                if not missing:
-                    break
-                logging.info(
-                    f"Retrying {len(missing)} missing processes "
-                    f"(attempt {attempt + 1}/{config.driver_max_retries_for_missing})"
-                )
-                all_exported_files.extend(
-                    _scrape_http_batch(
-                        missing,
-                        classe,
-                        config,
-                        session,
-                        out_file,
-                        output_dir,
-                        output_config,
-                        overwrite,
-                        timer,
-                        export_item,
-                    )
-                )
-
-        if all_exported_files:
-            for file_info in all_exported_files:
-                logging.info(f"Exported file: {file_info}")
-        else:
-            logging.warning(
-                f"{classe} {processo_inicial}-{processo_final}: NO FILES EXPORTED"
-            )
-    finally:
-        if timer.process_times:
-            logging.info("=== SCRAPER ENDED - SHOWING REPORT ===")
-            timer.log_summary()
-
-
-def _scrape_http_batch(
-    processos: list[int],
-    classe: str,
-    config: ScraperConfig,
-    session: requests.Session,
-    out_file: str,
-    output_dir: str,
-    output_config: Any,
-    overwrite: bool,
-    timer: Any,
-    export_item: Any,
-    *,
-    fetch_dje: bool = True,
-) -> list[str]:
-    exported: list[str] = []
-    for processo in processos:
-        processo_name = f"{classe} {processo}"
-        start = timer.start_process(processo_name)
-        logging.info(f"{processo_name}: iniciado")
-
-        try:
-            item = scrape_processo_http(
-                classe,
-                processo,
-                session=session,
-                config=config,
-                fetch_dje=fetch_dje,
-            )
-        except Exception as e:
-            logging.error(f"{processo_name}: {type(e).__name__}: {e}")
-            item = None
-
-        if item:
-            files = export_item(item, out_file, output_dir, output_config, overwrite)
-            exported.extend(files)
-            timer.end_process(processo_name, start, success=True)
-        else:
-            timer.end_process(processo_name, start, success=False)
-
-    return exported
-
-
 _TEMA_IN_ABASESSAO = re.compile(r"repgeral/votacao\?tema=(\d+)")
 
 
@@ -409,7 +291,7 @@ def _make_sessao_fetcher(
     def fetcher(param: str, value: int) -> str:
         tab = f"sessao_{param}_{value}"
         if use_cache:
-            hit = html_cache.read(classe, processo, tab)
+            hit = cache_buf.cached.get(tab)
             if hit is not None:
                 cache_buf.put(tab, hit, from_network=False)
                 return hit
@@ -453,6 +335,19 @@ def scrape_processo_http(
     Raises :class:`NoIncidenteError` when STF signals the process is
     unallocated (redirect without ``incidente=<n>``).
     """
+    if session is None:
+        # One session for every GET of this case (tabs, sessão JSON, DJe),
+        # so its connection pool is reused instead of re-handshaking.
+        with new_session() as owned:
+            return scrape_processo_http(
+                classe,
+                processo,
+                use_cache=use_cache,
+                session=owned,
+                config=config,
+                fetch_dje=fetch_dje,
+            )
+
     cache_buf = _CacheBuf()
     fetched = fetch_process(
         classe,
@@ -464,47 +359,43 @@ def scrape_processo_http(
     )
 
     detalhe_soup = BeautifulSoup(fetched.detalhe_html, "lxml")
+    badge_texts = ex.extract_badge_texts(detalhe_soup)
     info_soup = BeautifulSoup(fetched.tabs.get(TAB_INFORMACOES, ""), "lxml")
+    quadros = ex.extract_quadros(info_soup)
 
     partes = ex.extract_partes(fetched.tabs.get(TAB_PARTES, ""))
 
-    owns_session = session is None
-    sessao_session = session or new_session()
-    try:
-        tema = _extract_tema_from_abasessao(fetched.tabs.get(TAB_SESSAO, ""))
-        sessao_fetcher = _make_sessao_fetcher(
-            classe,
-            processo,
-            sessao_session,
-            cache_buf=cache_buf,
-            use_cache=use_cache,
-            config=config,
+    tema = _extract_tema_from_abasessao(fetched.tabs.get(TAB_SESSAO, ""))
+    sessao_fetcher = _make_sessao_fetcher(
+        classe,
+        processo,
+        session,
+        cache_buf=cache_buf,
+        use_cache=use_cache,
+        config=config,
+    )
+    sessao_virtual = sessao_ex.extract_sessao_virtual_from_json(
+        incidente=fetched.incidente,
+        tema=tema,
+        fetcher=sessao_fetcher,
+    )
+
+    publicacoes_dje: list[dict] = []
+    if fetch_dje:
+        listing_fetcher = _make_dje_listing_fetcher(
+            classe, processo, session,
+            cache_buf=cache_buf, use_cache=use_cache, config=config,
         )
-        sessao_virtual = sessao_ex.extract_sessao_virtual_from_json(
-            incidente=fetched.incidente,
-            tema=tema,
-            fetcher=sessao_fetcher,
+        detail_fetcher = _make_dje_detail_fetcher(
+            classe, processo, session,
+            cache_buf=cache_buf, use_cache=use_cache, config=config,
+        )
+        listing_html = listing_fetcher()
+        publicacoes_dje = dje_ex.parse_dje_listing(listing_html)
+        _resolve_publicacoes_dje(
+            publicacoes_dje,
+            detail_fetcher=detail_fetcher,
         )
-
-        publicacoes_dje: list[dict] = []
-        if fetch_dje:
-            listing_fetcher = _make_dje_listing_fetcher(
-                classe, processo, sessao_session,
-                cache_buf=cache_buf, use_cache=use_cache, config=config,
-            )
-            detail_fetcher = _make_dje_detail_fetcher(
-                classe, processo, sessao_session,
-                cache_buf=cache_buf, use_cache=use_cache, config=config,
-            )
-            listing_html = listing_fetcher()
-            publicacoes_dje = dje_ex.parse_dje_listing(listing_html)
-            _resolve_publicacoes_dje(
-                publicacoes_dje,
-                detail_fetcher=detail_fetcher,
-            )
-    finally:
-        if owns_session:
-            sessao_session.close()
 
     if cache_buf.dirty:
         html_cache.write_case(
@@ -526,17 +417,17 @@ def scrape_processo_http(
         processo_id=processo,
         url=_canonical_url(fetched.incidente),
         numero_unico=ex.extract_numero_unico(detalhe_soup),
-        meio=ex.extract_meio(detalhe_soup),
-        publicidade=ex.extract_publicidade(detalhe_soup),
+        meio=ex.extract_meio(badge_texts),
+        publicidade=ex.extract_publicidade(badge_texts),
         badges=ex.extract_badges(detalhe_soup),
         assuntos=ex.extract_assuntos(info_soup),
         data_protocolo=ex.extract_data_protocolo(info_soup),
         orgao_origem=ex.extract_orgao_origem(info_soup),
         origem=ex.extract_origem(info_soup),
         numero_origem=ex.extract_numero_origem(info_soup),
-        volumes=ex.extract_volumes(info_soup),
-        folhas=ex.extract_folhas(info_soup),
-        apensos=ex.extract_apensos(info_soup),
+        volumes=quadros["volumes"],
+        folhas=quadros["folhas"],
+        apensos=quadros["apensos"],
         relator=ex.extract_relator(detalhe_soup),
         primeiro_autor=ex.extract_primeiro_autor(partes),
         partes=partes,
@@ -0,0 +1,203 @@
+"""Range orchestration for the HTTP scraper: worker pool, export,
+missing-process retries.
+
+Split out of `scraper.py` to keep that file under the 600-line ceiling
+called out in CLAUDE.md. `scraper.py` scrapes one processo;
+`run_scraper_http` here walks a `[inicial, final]` range through
+`scrape_processo_http` and appends each finished item to the output
+file via `judex.data.export.export_items`.
+
+Library entry point only: no CLI command or pipeline stage calls it.
+Production scrapes go through `judex varrer-processos`
+(`judex.sweeps.run_sweep`), which writes one atomic JSON per processo.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Optional
+
+import requests
+
+from judex.config import ScraperConfig
+from judex.data.types import StfItem
+from judex.scraping.http_session import new_session
+from judex.scraping.scraper import scrape_processo_http
+
+
+def run_scraper_http(
+    classe: str,
+    processo_inicial: int,
+    processo_final: int,
+    output_format: str,
+    output_dir: str,
+    overwrite: bool,
+    config: ScraperConfig,
+    fetch_dje: bool = True,
+) -> None:
+    """HTTP-backed equivalent of src.scraping.scraper.run_scraper.
+
+    Shares the output path and missing-retry shape; swaps the per-process
+    Selenium drive for fetch_process + parse under a shared session.
+    """
+    from judex.data.export import export_items, handle_overwrite
+    from judex.data.missing import check_missing_processes
+    from judex.data.output import OutputConfig
+    from judex.utils.timing import ProcessTimer
+
+    out_file = f"{output_dir}/judex-mini_{classe}_{processo_inicial}-{processo_final}"
+    output_config = OutputConfig.from_format_string(output_format)
+    timer = ProcessTimer()
+    all_exported_files: list[str] = []
+    # Processo ids whose export_items append returned this run; retries
+    # diff against it instead of re-reading the output file on every
+    # attempt.
+    processed: set[int] = set()
+    # Once per run: every pass below appends to the same file.
+    handle_overwrite(overwrite, output_config, out_file)
+
+    try:
+        with new_session() as session:
+            processos = list(range(processo_inicial, processo_final + 1))
+            all_exported_files.extend(
+                _scrape_http_batch(
+                    processos,
+                    classe,
+                    config,
+                    session,
+                    out_file,
+                    output_dir,
+                    output_config,
+                    timer,
+                    export_items,
+                    processed,
+                    fetch_dje=fetch_dje,
+                )
+            )
+
+            # One disk scan (cold start): it also counts rows a previous
+            # run left in a non-overwritten output file.
+            missing = check_missing_processes(
+                classe,
+                processo_inicial,
+                processo_final,
+                output_dir,
+                output_config,
+            )
+            for attempt in range(config.driver_max_retries_for_missing):
+                missing = [p for p in missing if p not in processed]
+                if not missing:
+                    break
+                logging.info(
+                    f"Retrying {len(missing)} missing processes "
+                    f"(attempt {attempt + 1}/{config.driver_max_retries_for_missing})"
+                )
+                all_exported_files.extend(
+                    _scrape_http_batch(
+                        missing,
+                        classe,
+                        config,
+                        session,
+                        out_file,
+                        output_dir,
+                        output_config,
+                        timer,
+                        export_items,
+                        processed,
+                    )
+                )
+
+        # Closing disk scan: `processed` only says export_items returned,
+        # so re-read the file once to catch rows that never reached it.
+        lost = check_missing_processes(
+            classe,
+            processo_inicial,
+            processo_final,
+            output_dir,
+            output_config,
+        )
+        if lost:
+            logging.warning(
+                f"{classe} {processo_inicial}-{processo_final}: "
+                f"{len(lost)} processos still missing from output: {lost[:20]}"
+            )
+
+        if all_exported_files:
+            for file_info in all_exported_files:
+                logging.info(f"Exported file: {file_info}")
+        else:
+            logging.warning(
+                f"{classe} {processo_inicial}-{processo_final}: NO FILES EXPORTED"
+            )
+    finally:
+        if timer.processos:
+            logging.info("=== SCRAPER ENDED - SHOWING REPORT ===")
+            timer.log_summary()
+
+
+def _scrape_http_batch(
+    processos: list[int],
+    classe: str,
+    config: ScraperConfig,
+    session: requests.Session,
+    out_file: str,
+    output_dir: str,
+    output_config: Any,
+    timer: Any,
+    export_items: Any,
+    processed: set[int],
+    *,
+    fetch_dje: bool = True,
+) -> list[str]:
+    def scrape_one(processo: int) -> tuple[str, int, int, Optional[StfItem]]:
+        processo_name = f"{classe} {processo}"
+        start = timer.start_process(processo_name)
+        logging.info(f"{processo_name}: iniciado")
+        try:
+            item = scrape_processo_http(
+                classe,
+                processo,
+                session=session,
+                config=config,
+                fetch_dje=fetch_dje,
+            )
+        except Exception as e:
+            logging.error(f"{processo_name}: {type(e).__name__}: {e}")
+            item = None
+        return processo_name, start, time.perf_counter_ns(), item
+
+    # Scrapes overlap on the pool; export and bookkeeping stay on this
+    # thread, so the file appends never interleave.
+    exported: list[str] = []
+
+    # At most `workers` processos are in flight; the next one is submitted
+    # only when a slot frees. On Ctrl-C nothing is left queued behind the
+    # running scrapes.
+    workers = max(config.process_workers, 1)
+    todo = iter(processos)
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        in_flight = {pool.submit(scrape_one, p): p for p in islice(todo, workers)}
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                processo = in_flight.pop(fut)
+                processo_name, start, end, item = fut.result()
+                if item:
+                    exported.extend(
+                        export_items([item], out_file, output_dir, output_config)
+                    )
+                    processed.add(processo)
+                timer.end_process(
+                    processo_name, start, success=bool(item), end_time=end
+                )
+                nxt = next(todo, None)
+                if nxt is not None:
+                    in_flight[pool.submit(scrape_one, nxt)] = nxt
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return exported
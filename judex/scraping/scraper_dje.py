@@ -19,7 +19,6 @@ import requests
 from judex.config import ScraperConfig
 from judex.scraping.extraction import dje as dje_ex
 from judex.scraping.http_session import _decode, _http_get_with_retry
-from judex.utils import html_cache
 
 if TYPE_CHECKING:
     from judex.scraping.scraper import _CacheBuf
@@ -99,7 +98,7 @@ def _make_dje_listing_fetcher(
     def fetcher() -> str:
         tab = TAB_DJE_LISTING
         if use_cache:
-            hit = html_cache.read(classe, processo, tab)
+            hit = cache_buf.cached.get(tab)
             if hit is not None:
                 cache_buf.put(tab, hit, from_network=False)
                 return hit
@@ -121,7 +120,7 @@ def _make_dje_detail_fetcher(
     def fetcher(url: str) -> str:
         tab = _dje_detail_cache_key(url)
         if use_cache:
-            hit = html_cache.read(classe, processo, tab)
+            hit = cache_buf.cached.get(tab)
             if hit is not None:
                 cache_buf.put(tab, hit, from_network=False)
                 return hit
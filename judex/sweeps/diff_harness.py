@@ -21,7 +21,7 @@ from typing import Any
 # pin the parsers, and the list is reverse-chronological so drift
 # would land at index 0 (head-growth), not at the tail where
 # _diff_growing_list expects it.
-SKIP_FIELDS = {
+SKIP_FIELDS: frozenset[str] = frozenset({
     "_meta",
     "extraido",
     "sessao_virtual",
@@ -29,10 +29,12 @@ SKIP_FIELDS = {
     "status_http",
     "outcome",
     "schema_version",
-}
+})
 
 # Lists that can grow over time as the process adds new events.
-GROWING_LISTS = {"andamentos", "peticoes", "recursos", "deslocamentos"}
+GROWING_LISTS: frozenset[str] = frozenset(
+    {"andamentos", "peticoes", "recursos", "deslocamentos"}
+)
 
 
 def _clip(v: Any, limit: int = 200) -> str:
@@ -66,9 +68,9 @@ def _diff_growing_list(key: str, http_list: list, gt_list: list) -> list[str]:
 
 def diff_item(http: dict, other: dict, *, allow_growth: bool = False) -> list[str]:
     messages: list[str] = []
-    for k in sorted(set(http) | set(other)):
-        if k in SKIP_FIELDS:
-            continue
+    # Key views support set algebra directly: one union, skip fields
+    # dropped up front rather than tested per key.
+    for k in sorted((http.keys() | other.keys()) - SKIP_FIELDS):
         a = http.get(k)
         b = other.get(k)
         if a == b:
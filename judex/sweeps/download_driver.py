@@ -1,8 +1,8 @@
 """Download driver — the WAF-bound half of the PDF pipeline.
 
 This is the ONLY path that talks to STF after the 2026-04-19 split.
-It fetches `PecaTarget.url` via `_http_get_with_retry` and writes the
-raw bytes to `data/raw/pecas/<sha1>.<ext>.gz`. Text extraction is an
+It fetches `PecaTarget.url` via `_http_get_bytes_with_retry` and writes
+the raw bytes to `data/raw/pecas/<sha1>.<ext>.gz`. Text extraction is an
 independent concern, handled by `extract_driver.run_extract_sweep`.
 
 Layout under `out_dir` is shared with the process sweep convention:
@@ -39,7 +39,11 @@ from typing import Any, Callable, Optional
 import requests
 
 from judex.config import ScraperConfig
-from judex.scraping.http_session import _http_get_with_retry, new_session
+from judex.scraping.http_session import (
+    ResponseTooLargeError,
+    _http_get_bytes_with_retry,
+    new_session,
+)
 from judex.scraping.proxy_pool import ProxyPool
 from judex.sweeps import shared as _shared
 from judex.utils.cost import estimate_proxy_cost
@@ -68,8 +72,9 @@ class _Counters:
 def _default_getter(
     session: Any, target: PecaTarget, config: ScraperConfig
 ) -> bytes:
-    r = _http_get_with_retry(session, target.url, config=config, timeout=60)
-    return r.content
+    return _http_get_bytes_with_retry(
+        session, target.url, max_bytes=config.peca_max_bytes, config=config,
+    )
 
 
 def run_download_sweep(
@@ -205,6 +210,12 @@ def run_download_sweep(
         body: Optional[bytes] = None
         try:
             body = get_fn(session_holder["session"], tgt, config)
+        except ResponseTooLargeError as e:
+            # Past `peca_max_bytes` — the same link will be just as big
+            # next time, so keep it out of errors.jsonl replay.
+            status = "oversized_response"
+            error_type = "ResponseTooLarge"
+            error = str(e)
         except Exception as e:
             status = "http_error"
             etype, hstatus, _ = _shared.classify_exception(e)
@@ -288,6 +288,10 @@ def _classify_baixar(row: dict) -> Kind:
         return "transient"
     if status == "non_document_response":
         return "transient"
+    # Body past `peca_max_bytes` (`oversized_response` in `baixar-pecas`,
+    # `oversized` in `executar`): the link is just as big on replay.
+    if status in ("oversized_response", "oversized"):
+        return "terminal"
     if status == "http_error":
         if http_status == 404:
             return "terminal"
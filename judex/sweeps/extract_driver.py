@@ -22,6 +22,7 @@ regardless of `--provedor`. Preserves parity with the prior
 
 from __future__ import annotations
 
+import hashlib
 import logging
 
 from judex.utils.log_render import (
@@ -31,7 +32,7 @@ from judex.utils.log_render import (
 )
 import threading
 import time
-from collections import Counter
+from collections import Counter, OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -65,6 +66,14 @@ class _Counters:
     outlier_skipped: int = 0
 
 
+# Provider results memoized per run, keyed by (blake2b(bytes), provider).
+# The same peça is often reachable under more than one URL (an andamento
+# link and a sessão documento, say); peca_cache is URL-keyed, so without
+# this each URL pays a full parse — or a paid OCR call — for identical
+# bytes. Bounded so a long sweep doesn't pin every extracted text.
+_DIGEST_MEMO_SIZE = 256
+
+
 def _detect_bytes_type(body: bytes) -> str:
     prefix = body[:100]
     if prefix.startswith(b"%PDF"):
@@ -109,8 +118,8 @@ def run_extract_sweep(
     paralelo > 1 when ``provedor`` is a thin HTTP client (tesseract_fly,
     tesseract_modal, mistral) where most wall is network-bound and the
     GIL releases on the C-extension request call. Local providers
-    (pypdf, tesseract) are CPU-bound and gain no throughput from thread
-    fanout — leave at 1.
+    (pypdf, pymupdf, tesseract) are CPU-bound and gain no throughput
+    from thread fanout — leave at 1.
 
     Returns `(extracted, cached_hits, no_bytes, failed)`.
     """
@@ -132,6 +141,18 @@ def run_extract_sweep(
     dispatch_fn: DispatcherFn = dispatcher or _dispatch_extract
 
     counters = _Counters()
+    by_digest: OrderedDict[tuple[bytes, str], ExtractResult] = OrderedDict()
+
+    def extract_memo(body: bytes, cfg: OCRConfig) -> ExtractResult:
+        key = (hashlib.blake2b(body, digest_size=16).digest(), cfg.provider)
+        result = by_digest.get(key)
+        if result is None:
+            result = dispatch_fn(body, cfg)
+            by_digest[key] = result
+            if len(by_digest) > _DIGEST_MEMO_SIZE:
+                by_digest.popitem(last=False)
+        return result
+
     started = datetime.now(timezone.utc)
     print(
         f"=== pdf extract · provedor={provedor} · "
@@ -199,7 +220,7 @@ def run_extract_sweep(
                 text = extract_rtf_text(body) or ""
                 extractor_label = "rtf"
             elif kind == "pdf":
-                result = dispatch_fn(body, target_ocr_config)
+                result = extract_memo(body, target_ocr_config)
                 text = result.text
                 elements = result.elements
                 extractor_label = result.provider or target_provedor
@@ -28,7 +28,7 @@ from judex.sweeps.peca_classification import filter_substantive, summarize_tipos
 
 
 _PROVIDERS = (
-    "pypdf", "mistral", "chandra", "unstructured",
+    "pypdf", "pymupdf", "mistral", "chandra", "unstructured",
     "tesseract", "tesseract_modal", "tesseract_fly", "auto",
 )
 
@@ -66,7 +66,7 @@ def pick_provider(target) -> str:
 def _build_ocr_config(provedor: str) -> OCRConfig:
     """Assemble an OCRConfig from env vars appropriate to the provider.
 
-    Local providers (pypdf, tesseract) need no API key; tesseract_modal
+    Local providers (pypdf, pymupdf, tesseract) need no API key; tesseract_modal
     is the Modal-hosted variant and uses the deployed app's auth, no
     env var here. tesseract_fly's address is read from FLY_TESSERACT_URL
     by the provider itself (no API key required for the public deploy).
@@ -74,7 +74,9 @@ def _build_ocr_config(provedor: str) -> OCRConfig:
     UNSTRUCTURED_API_KEY, CHANDRA_API_KEY); missing keys raise early
     with a clear message.
     """
-    if provedor in ("pypdf", "tesseract", "tesseract_modal", "tesseract_fly"):
+    if provedor in (
+        "pypdf", "pymupdf", "tesseract", "tesseract_modal", "tesseract_fly",
+    ):
         return OCRConfig(provider=provedor, api_key="")
 
     env_key = {
@@ -27,13 +27,15 @@ class PecaAttemptRecord:
     wall_s: float
     # Status values across download + extract drivers:
     #   download: "ok" | "cached" | "http_error" | "empty_response"
-    #             | "non_document_response"
+    #             | "non_document_response" | "oversized_response"
     #   extract:  "ok" | "cached" | "no_bytes" | "empty" | "provider_error"
     #             | "unknown_type"
     # `empty_response` = STF returned 200 OK with no body (transient edge
     # glitch; URL goes to errors.jsonl for replay). `non_document_response`
     # = body had unexpected magic bytes (HTML soft-error page, etc.;
     # `peca_cache.write_bytes` rejects → driver routes to errors.jsonl).
+    # `oversized_response` = body past `ScraperConfig.peca_max_bytes`;
+    # terminal, never replayed.
     # Legacy `varrer-pdfs` also emitted "extract_error" (fetch+extract fused);
     # that driver was retired in the 2026-04-19 split.
     status: str
@@ -42,7 +44,7 @@ class PecaAttemptRecord:
     http_status: Optional[int] = None
     # Extractor / producer label:
     #   download: "bytes" (always, regardless of outcome)
-    #   extract:  "pypdf" | "rtf" | "mistral" | "chandra" | "unstructured"
+    #   extract:  "pypdf" | "pymupdf" | "rtf" | "mistral" | "chandra" | "unstructured"
     extractor: Optional[str] = None
     chars: Optional[int] = None
     processo_id: Optional[int] = None
@@ -39,7 +39,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Iterator, Optional
 
-from judex.pipeline.log import classify_unified_error
+from judex.pipeline.log import _TERMINAL_OK_STATUSES, classify_unified_error
 from judex.pipeline.recovery_policy import RETRY_CAP
 from judex.pipeline.state import PipelineState
 
@@ -153,9 +153,6 @@ def discover_run_dirs(run_dir: Path) -> list[Path]:
 # ---------------------------------------------------------------------------
 
 
-_TERMINAL_OK_STATUSES: frozenset[str] = frozenset({"ok", "skipped_cached"})
-
-
 # extract_text statuses that route to PROVIDER_SWITCH (kind=terminal in
 # the classifier, but actionable via a different OCR provider). The
 # destination provider depends on which status: ``empty`` → chandra
@@ -33,7 +33,6 @@ import shutil
 import subprocess
 import sys
 import time
-import urllib3
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -50,10 +49,9 @@ from judex.sweeps.process_store import (
     AttemptRecord, SweepStore, processos_for_replay,
 )
 from judex.utils.log_render import render_progress_line, render_target_line
+from judex.utils.json_io import read_json
 from judex.scraping.scraper import NoIncidenteError, scrape_processo_http
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
 
 def _redact_proxy(url: Optional[str]) -> str:
     """Strip user:pass from a proxy URL before it lands in any log.
@@ -94,7 +92,7 @@ _INT_COLS = {"incidente", "processo_id", "volumes", "folhas", "apensos", "status
 
 # Fields we skip when diffing because they're known to differ by design
 # (matches src.sweeps.diff_harness.SKIP_FIELDS).
-_CSV_SKIP_FIELDS = {"extraido", "sessao_virtual", "status"}
+_CSV_SKIP_FIELDS = frozenset({"extraido", "sessao_virtual", "status"})
 
 
 # ----- CSV parsing ---------------------------------------------------------
@@ -281,19 +279,38 @@ def _collect_unknown_extractors(item: dict[str, Any]) -> set[str]:
 # ----- Parity sources -----------------------------------------------------
 
 
-def load_gt_fixture(parity_dir: Path, classe: str, processo: int) -> Optional[dict[str, Any]]:
-    # Ground truth filenames use underscore + number; some include a suffix
-    # (e.g. ADI_2820_reread.json). Prefer exact match, fall back to prefix.
-    exact = parity_dir / f"{classe}_{processo}.json"
-    if exact.exists():
-        return _load_fixture_file(exact)
-    for candidate in parity_dir.glob(f"{classe}_{processo}_*.json"):
-        return _load_fixture_file(candidate)
-    return None
+def load_gt_fixture(
+    gt_index: dict[tuple[str, str], Path], classe: str, processo: int
+) -> Optional[dict[str, Any]]:
+    path = gt_index.get((classe, str(processo)))
+    return _load_fixture_file(path) if path is not None else None
+
+
+def index_gt_dir(parity_dir: Path) -> dict[tuple[str, str], Path]:
+    """Map (classe, processo) → fixture path from one directory listing.
+
+    Ground truth filenames use underscore + number; some include a suffix
+    (e.g. ADI_2820_reread.json). Prefer exact match, fall back to prefix.
+    Keys keep the filename's digits as text, so `HC_01.json` is not
+    processo 1. Built once per sweep and passed down, instead of a stat +
+    glob per case.
+    """
+    exact: dict[tuple[str, str], Path] = {}
+    suffixed: dict[tuple[str, str], Path] = {}
+    for path in sorted(parity_dir.glob("*.json")):
+        parts = path.stem.split("_", 2)
+        if len(parts) < 2 or not parts[1].isdigit():
+            continue
+        key = (parts[0], parts[1])
+        if len(parts) == 2:
+            exact[key] = path
+        else:
+            suffixed.setdefault(key, path)
+    return {**suffixed, **exact}
 
 
 def _load_fixture_file(path: Path) -> dict[str, Any]:
-    return json.load(path.open())
+    return read_json(path)
 
 
 def load_parity_csv(path: Path) -> dict[tuple[str, int], dict[str, Any]]:
@@ -356,7 +373,7 @@ def run_one(
     source: Optional[str],
     session: Any,
     counter: RetryCounter,
-    gt_dir: Optional[Path],
+    gt_index: Optional[dict[tuple[str, str], Path]],
     parity_csv: Optional[dict[tuple[str, int], dict[str, Any]]],
     *,
     config: Optional[Any] = None,
@@ -420,8 +437,8 @@ def run_one(
         _write_item_json(items_dir, classe, processo, item_dict)
 
     diffs: list[str] = []
-    if gt_dir is not None:
-        gt = load_gt_fixture(gt_dir, classe, processo)
+    if gt_index is not None:
+        gt = load_gt_fixture(gt_index, classe, processo)
         if gt is not None:
             diffs = diff_item(item_dict, gt, allow_growth=True)
     elif parity_csv is not None:
@@ -749,6 +766,8 @@ def _run_passes(
     detector = _shared.CliffDetector(window=cliff_window)
     # Track prior regime so we only print on transitions, not every record.
     last_regime: dict[str, str] = {"value": "warming"}
+    # One directory listing per sweep; run_one looks fixtures up in it.
+    gt_index = index_gt_dir(parity_dir) if parity_dir is not None else None
 
     # Session holder — mutable so proxy rotation can swap sessions mid-loop
     # without reaching into closure cells. `on_item_cold` reads session via
@@ -791,7 +810,7 @@ def _run_passes(
         classe, processo, source = row
         res = run_one(
             classe, processo, source, session_holder["session"], counter,
-            parity_dir, parity_csv, config=config,
+            gt_index, parity_csv, config=config,
             items_dir=items_dir,
         )
         cold_results.append(res)
@@ -903,7 +922,7 @@ def _run_passes(
                 classe, processo, source = row
                 res = run_one(
                     classe, processo, source, session_holder["session"], counter,
-                    parity_dir, parity_csv, config=config,
+                    gt_index, parity_csv, config=config,
                     items_dir=items_dir,
                 )
                 warm_results.append(res)
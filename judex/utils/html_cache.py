@@ -48,6 +48,32 @@ def read(classe: str, processo: int, tab: str) -> str | None:
         return fp.read().decode("utf-8")
 
 
+def read_case(classe: str, processo: int) -> tuple[int | None, dict[str, str]]:
+    """Return `(incidente, {tab: html})` for a whole archive in one pass.
+
+    `read`/`read_incidente` reopen and re-inflate the archive per member;
+    a scrape or rebuild that needs most of the case should call this once
+    instead. An absent archive reads as `(None, {})`.
+    """
+    archive = _archive_path(classe, processo)
+    incidente: int | None = None
+    tabs: dict[str, str] = {}
+    if not archive.exists():
+        return incidente, tabs
+    with tarfile.open(archive, "r:gz") as tf:
+        for info in tf:
+            fp = tf.extractfile(info)
+            if fp is None:
+                continue
+            text = fp.read().decode("utf-8")
+            if info.name == _INCIDENTE_MEMBER:
+                text = text.strip()
+                incidente = int(text) if text.isdigit() else None
+            elif info.name.endswith(".html"):
+                tabs[info.name.removesuffix(".html")] = text
+    return incidente, tabs
+
+
 def read_incidente(classe: str, processo: int) -> int | None:
     archive = _archive_path(classe, processo)
     if not archive.exists():
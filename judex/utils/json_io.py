@@ -0,0 +1,34 @@
+"""JSON file reader with an optional orjson fast path.
+
+The warehouse build, renormalize and ground-truth diffs each parse
+thousands of case JSONs per run. ``orjson`` parses straight from bytes
+(no UTF-8 decode into a ``str`` first) and builds the same dict/list
+objects several times faster than stdlib ``json``. It is an optional
+extra (``pip install judex-mini[fast-json]``); without it ``read_json``
+is exactly ``json.loads(path.read_text("utf-8"))``.
+
+orjson is stricter than stdlib on a few inputs stdlib tolerates (NaN /
+Infinity literals, integers wider than 64 bits). Those fall back to the
+stdlib parser so both paths accept the same files.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def read_json(path: Path) -> Any:
+    if orjson is not None:
+        data = path.read_bytes()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data.decode("utf-8"))
+    return json.loads(path.read_text(encoding="utf-8"))
@@ -67,6 +67,8 @@ _STATUS_STYLE: dict[str, tuple[str, str]] = {
     "http_error":      ("✗", _ANSI_RED),
     "unknown_type":    ("✗", _ANSI_RED),
     "non_document_response": ("✗", _ANSI_RED),
+    "oversized":       ("✗", _ANSI_RED),
+    "oversized_response": ("✗", _ANSI_RED),
     # warning-ish
     "anomaly":         ("⚠", _ANSI_YELLOW),
 }
@@ -1,4 +1,5 @@
 import logging
+import re
 from io import BytesIO
 from typing import Optional
 from urllib.parse import urlparse
@@ -47,23 +48,24 @@ def extract_pdf_text_from_content(content: bytes) -> Optional[str]:
 
     try:
         reader = PdfReader(BytesIO(content))  # type: ignore
-        text = ""
-
-        for page in reader.pages:
-            # "plain" emits running prose; "layout" preserved x-coordinate
-            # gaps, which reproduced STF's letter-spaced titles as
-            # `O S   ENHOR  M  INISTRO` and forced downstream re-collapsing.
-            page_text = page.extract_text()
-
-            if page_text:
-                text += page_text + "\n"
-
-        return text.strip() if text else None
+        # "plain" emits running prose; "layout" preserved x-coordinate
+        # gaps, which reproduced STF's letter-spaced titles as
+        # `O S   ENHOR  M  INISTRO` and forced downstream re-collapsing.
+        pages_text = [t for page in reader.pages if (t := page.extract_text())]
+        return "\n".join(pages_text).strip() if pages_text else None
     except Exception as e:
         logging.debug(f"PyPDF failed: {e}")
         return None
 
 
+# Hex payload of embedded pictures (`{\pict ... 89504e47...}`, e.g. a
+# letterhead image). striprtf's tokenizer steps through it one
+# regex match per character only to discard it with the `pict`
+# destination, so it dominates parse time on RTFs that carry an image.
+# Prose never forms a 256-char run of bare hex digits and line breaks.
+_RTF_HEX_BLOB = re.compile(r"(?<=\s)[0-9a-fA-F\r\n]{256,}")
+
+
 def extract_rtf_text(content: bytes) -> Optional[str]:
     """Extract text from RTF content"""
     try:
@@ -71,7 +73,7 @@ def extract_rtf_text(content: bytes) -> Optional[str]:
         # stream, not as raw UTF-8. striprtf resolves those internally, so
         # latin-1 decode preserves the byte stream losslessly before parsing.
         rtf_text = content.decode("latin-1", errors="ignore")
-        plain_text = rtf_to_text(rtf_text)
+        plain_text = rtf_to_text(_RTF_HEX_BLOB.sub("", rtf_text))
         return plain_text.strip()
     except Exception as e:
         logging.warning(f"Failed to extract RTF text: {e}")
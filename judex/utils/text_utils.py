@@ -2,9 +2,13 @@
 Text processing utilities
 """
 
-import re
-
 
 def normalize_spaces(text: str) -> str:
-    """Normalize whitespace in text"""
-    return re.sub(r"\s+", " ", text).strip()
+    """Normalize whitespace in text.
+
+    ``str.split()`` with no argument splits on exactly the characters
+    ``re`` treats as ``\\s`` in str patterns (``str.isspace``, NBSP
+    included), so this collapses the same runs as
+    ``re.sub(r"\\s+", " ", text).strip()`` at a fraction of the cost.
+    """
+    return " ".join(text.split())
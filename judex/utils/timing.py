@@ -4,23 +4,33 @@ Timing utilities for process extraction
 
 import functools
 import logging
+import os
 import time
-from typing import Callable
+from array import array
+from typing import Callable, Optional
 
 
 def track_extraction_timing(func: Callable) -> Callable:
-    """Decorator to track extraction function timing"""
+    """Decorator to track extraction function timing.
+
+    Only wraps when ``JUDEX_PROFILE`` is set at import time; otherwise
+    returns ``func`` untouched, so the per-field extractors pay no
+    wrapper frame on every case. Failures still propagate either way —
+    the scraper logs them per process.
+    """
+    if not os.environ.get("JUDEX_PROFILE"):
+        return func
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             logging.debug(f"{duration:.3f}s - {func.__name__}")
             return result
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             logging.warning(f"{func.__name__} failed after {duration:.3f}s: {e}")
             raise
 
@@ -28,60 +38,71 @@ def track_extraction_timing(func: Callable) -> Callable:
 
 
 class ProcessTimer:
-    """Track timing for multiple processes"""
+    """Track timing for multiple processes.
+
+    Results are kept as parallel columns (name, duration, success) so
+    `log_summary` takes its stats over compact typed arrays instead of
+    re-walking a list of dicts per statistic.
+    """
 
     def __init__(self):
-        self.process_times: list[dict] = []
-        self.total_start_time = time.time()
+        self.processos: list[str] = []
+        self.durations = array("d")
+        self.successes = array("b")
+        self.total_start_time = time.perf_counter()
 
-    def start_process(self, processo: str) -> float:
-        """Start timing a process and return start time"""
-        return time.time()
+    def start_process(self, processo: str) -> int:
+        """Start timing a process and return its perf_counter_ns start."""
+        return time.perf_counter_ns()
 
     def end_process(
-        self, processo: str, start_time: float, success: bool = True
+        self,
+        processo: str,
+        start_time: int,
+        success: bool = True,
+        end_time: Optional[int] = None,
     ) -> None:
-        """End timing a process and record the results"""
-        end_time = time.time()
-        duration = end_time - start_time
+        """End timing a process and record the results.
 
-        process_info = {
-            "processo": processo,
-            "duration": round(duration, 2),
-            "success": success,
-        }
-        self.process_times.append(process_info)
+        ``end_time`` is the perf_counter_ns the work finished at, for
+        callers that record the result later than that (pool workers
+        handing back to the main thread). Defaults to now.
+        """
+        end = time.perf_counter_ns() if end_time is None else end_time
+        duration = (end - start_time) / 1e9
+
+        self.processos.append(processo)
+        self.durations.append(duration)
+        self.successes.append(success)
 
         logging.info(f"{processo}: concluído em {duration:.1f}s")
 
     def log_summary(self) -> None:
         """Log comprehensive timing summary"""
-        total_end_time = time.time()
-        total_duration = total_end_time - self.total_start_time
+        total_duration = time.perf_counter() - self.total_start_time
 
         # Calculate statistics
-        successful_processes = [p for p in self.process_times if p["success"]]
-
-        if successful_processes:
-            avg_duration = sum(p["duration"] for p in successful_processes) / len(
-                successful_processes
-            )
-            min_duration = min(p["duration"] for p in successful_processes)
-            max_duration = max(p["duration"] for p in successful_processes)
+        successful = [d for d, ok in zip(self.durations, self.successes) if ok]
+        total_successful = len(successful)
+
+        if total_successful:
+            avg_duration = sum(successful) / total_successful
+            min_duration = min(successful)
+            max_duration = max(successful)
         else:
             avg_duration = min_duration = max_duration = 0
 
         # Calculate items per minute
-        total_successful = len(successful_processes)
         items_per_minute = (
             (total_successful / total_duration) * 60 if total_duration > 0 else 0
         )
 
-        logging.debug("Tempos dos processos:")
-        for process in self.process_times:
-            logging.debug(f"{process['processo']}: {process['duration']:.2f}s")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Tempos dos processos:")
+            for processo, duration in zip(self.processos, self.durations):
+                logging.debug(f"{processo}: {duration:.2f}s")
 
-        if successful_processes:
+        if total_successful:
             logging.info(f"Tempo médio por processo: {avg_duration:.2f}s")
             logging.info(f"Processo mais rápido: {min_duration:.2f}s")
             logging.info(f"Processo mais lento: {max_duration:.2f}s")
@@ -90,5 +111,5 @@ class ProcessTimer:
             f"Tempo total: {int(total_duration // 3600)}h {int((total_duration % 3600) // 60)}m {int(total_duration % 60)}s"
         )
 
-        logging.info(f"Total de processos: {len(self.process_times)}")
+        logging.info(f"Total de processos: {len(self.processos)}")
         logging.info(f"Taxa de processamento: {items_per_minute:.2f} itens/min")
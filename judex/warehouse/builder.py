@@ -30,6 +30,7 @@ import duckdb
 import pyarrow as pa
 
 from judex.scraping.extraction._shared import to_iso
+from judex.utils.json_io import read_json
 
 
 def _resolve_text(
@@ -531,7 +532,7 @@ def _validate_population_rates(
 
 
 def _load_case(path: Path) -> Optional[dict]:
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = read_json(path)
     if isinstance(raw, list):
         return raw[0] if raw else None
     return raw if isinstance(raw, dict) else None
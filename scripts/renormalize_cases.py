@@ -32,8 +32,8 @@ Usage
     # Rebuild one classe.
     PYTHONPATH=. uv run python scripts/renormalize_cases.py --classe HC
 
-    # Rebuild everything, in parallel.
-    PYTHONPATH=. uv run python scripts/renormalize_cases.py --workers 8
+    # Rebuild everything, serially (default is one worker per core).
+    PYTHONPATH=. uv run python scripts/renormalize_cases.py --workers 1
 
     # Force renormalization even for files already at SCHEMA_VERSION.
     PYTHONPATH=. uv run python scripts/renormalize_cases.py --force
@@ -51,9 +51,10 @@ import logging
 import os
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any, Optional
 
@@ -83,6 +84,7 @@ from judex.scraping.scraper_dje import (
 )
 from judex.data.reshape import reshape_to_v8
 from judex.utils import html_cache
+from judex.utils.json_io import read_json
 
 CASES_ROOT = Path("data/source/processos")
 
@@ -98,18 +100,20 @@ class CacheMiss(Exception):
     pass
 
 
-def _cache_only_sessao_fetcher(classe: str, processo: int):
+def _cache_only_sessao_fetcher(cached: dict[str, str]):
     """Sessão JSON fetcher that refuses to hit the network."""
     def fetcher(param: str, value: int) -> str:
         tab = f"sessao_{param}_{value}"
-        hit = html_cache.read(classe, processo, tab)
+        hit = cached.get(tab)
         if hit is None:
             raise CacheMiss(f"sessao cache miss: {tab}")
         return hit
     return fetcher
 
 
-def _rebuild_publicacoes_dje(classe: str, processo: int) -> list[dict]:
+def _rebuild_publicacoes_dje(
+    classe: str, processo: int, cached: dict[str, str]
+) -> list[dict]:
     """Reconstruct `publicacoes_dje` from html_cache.
 
     Tolerant of missing cache because DJe is v7-new — pre-v7 archives
@@ -122,15 +126,13 @@ def _rebuild_publicacoes_dje(classe: str, processo: int) -> list[dict]:
     lives in ``peca_cache`` and is materialised by ``baixar-pecas``
     + ``extrair-pecas``, never by this renormalizer.
     """
-    listing_html = html_cache.read(classe, processo, TAB_DJE_LISTING)
+    listing_html = cached.get(TAB_DJE_LISTING)
     if listing_html is None:
         return []
     entries = dje_ex.parse_dje_listing(listing_html)
     out: list[dict] = []
     for entry in entries:
-        detail_html = html_cache.read(
-            classe, processo, _dje_detail_cache_key(entry["detail_url"])
-        )
+        detail_html = cached.get(_dje_detail_cache_key(entry["detail_url"]))
         if detail_html is None:
             logging.warning(
                 f"{classe} {processo}: DJe detail cache miss for {entry['detail_url']}"
@@ -167,25 +169,22 @@ _OPTIONAL_TABS: tuple[str, ...] = (
 )
 
 
-def _read_all_cached(classe: str, processo: int) -> Optional[dict[str, str]]:
+def _read_all_cached(cached: dict[str, str]) -> Optional[dict[str, str]]:
     """Return dict of {tab: html} or None if any required fragment is missing.
 
+    `cached` is the archive as returned by `html_cache.read_case`.
     Optional tabs fall through as empty strings when absent. This keeps
     pre-v6 cache archives (which predate `abaPautas` + `abaDecisoes`)
     renormalizable from partes + andamentos alone.
     """
     out: dict[str, str] = {}
-    detalhe = html_cache.read(classe, processo, DETALHE)
-    if detalhe is None:
-        return None
-    out[DETALHE] = detalhe
-    for tab in _REQUIRED_TABS:
-        h = html_cache.read(classe, processo, tab)
+    for tab in (DETALHE, *_REQUIRED_TABS):
+        h = cached.get(tab)
         if h is None:
             return None
         out[tab] = h
     for tab in _OPTIONAL_TABS:
-        out[tab] = html_cache.read(classe, processo, tab) or ""
+        out[tab] = cached.get(tab) or ""
     return out
 
 
@@ -195,16 +194,18 @@ def _rebuild_item(classe: str, processo: int) -> Optional[StfItem]:
     Purely offline. Raises CacheMiss through sessao_virtual if its
     JSON endpoints weren't captured; callers treat that as needs_rescrape.
     """
-    incidente = html_cache.read_incidente(classe, processo)
+    incidente, cached = html_cache.read_case(classe, processo)
     if incidente is None:
         return None
 
-    tabs = _read_all_cached(classe, processo)
+    tabs = _read_all_cached(cached)
     if tabs is None:
         return None
 
     detalhe_soup = BeautifulSoup(tabs[DETALHE], "lxml")
+    badge_texts = ex.extract_badge_texts(detalhe_soup)
     info_soup = BeautifulSoup(tabs[TAB_INFORMACOES], "lxml")
+    quadros = ex.extract_quadros(info_soup)
 
     partes = ex.extract_partes(tabs[TAB_PARTES])
 
@@ -213,7 +214,7 @@ def _rebuild_item(classe: str, processo: int) -> Optional[StfItem]:
         sessao_virtual = sessao_ex.extract_sessao_virtual_from_json(
             incidente=incidente,
             tema=tema,
-            fetcher=_cache_only_sessao_fetcher(classe, processo),
+            fetcher=_cache_only_sessao_fetcher(cached),
         )
     except CacheMiss:
         return None
@@ -230,17 +231,17 @@ def _rebuild_item(classe: str, processo: int) -> Optional[StfItem]:
         processo_id=processo,
         url=_canonical_url(incidente),
         numero_unico=ex.extract_numero_unico(detalhe_soup),
-        meio=ex.extract_meio(detalhe_soup),
-        publicidade=ex.extract_publicidade(detalhe_soup),
+        meio=ex.extract_meio(badge_texts),
+        publicidade=ex.extract_publicidade(badge_texts),
         badges=ex.extract_badges(detalhe_soup),
         assuntos=ex.extract_assuntos(info_soup),
         data_protocolo=ex.extract_data_protocolo(info_soup),
         orgao_origem=ex.extract_orgao_origem(info_soup),
         origem=ex.extract_origem(info_soup),
         numero_origem=ex.extract_numero_origem(info_soup),
-        volumes=ex.extract_volumes(info_soup),
-        folhas=ex.extract_folhas(info_soup),
-        apensos=ex.extract_apensos(info_soup),
+        volumes=quadros["volumes"],
+        folhas=quadros["folhas"],
+        apensos=quadros["apensos"],
         relator=ex.extract_relator(detalhe_soup),
         primeiro_autor=ex.extract_primeiro_autor(partes),
         partes=partes,
@@ -250,7 +251,7 @@ def _rebuild_item(classe: str, processo: int) -> Optional[StfItem]:
         peticoes=ex.extract_peticoes(tabs[TAB_PETICOES]),
         recursos=ex.extract_recursos(tabs[TAB_RECURSOS]),
         pautas=ex.extract_pautas(tabs[TAB_PAUTAS]),
-        publicacoes_dje=_rebuild_publicacoes_dje(classe, processo),
+        publicacoes_dje=_rebuild_publicacoes_dje(classe, processo, cached),
         outcome=ex.derive_outcome({
             "sessao_virtual": sessao_virtual,
             "andamentos": andamentos,
@@ -259,7 +260,7 @@ def _rebuild_item(classe: str, processo: int) -> Optional[StfItem]:
 
 
 def _load_existing(path: Path) -> dict:
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = read_json(path)
     if isinstance(raw, list):
         return raw[0] if raw else {}
     return raw or {}
@@ -369,8 +370,15 @@ def main(argv: Optional[list[str]] = None) -> int:
         help="classify every file, but don't write anything.",
     )
     ap.add_argument(
-        "--workers", type=int, default=1,
-        help="parallel worker count (default: 1; extractors are CPU-bound).",
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help=(
+            "parallel worker processes (default: one per core; "
+            "extractors are CPU-bound)."
+        ),
+    )
+    ap.add_argument(
+        "--chunksize", type=int, default=64,
+        help="files handed to a worker per IPC round-trip (default: 64).",
     )
     ap.add_argument(
         "--limit", type=int, default=0,
@@ -437,19 +445,15 @@ def main(argv: Optional[list[str]] = None) -> int:
                 i,
             )
     else:
+        # map() with a chunksize ships paths to workers in batches
+        # rather than one pickled future per file.
+        work = partial(
+            _process_file, force=args.force, dry_run=args.dry_run, mode=args.mode
+        )
         with ProcessPoolExecutor(max_workers=args.workers) as pool:
-            futures = [
-                pool.submit(
-                    _process_file,
-                    p,
-                    force=args.force,
-                    dry_run=args.dry_run,
-                    mode=args.mode,
-                )
-                for p in paths
-            ]
-            for i, fut in enumerate(as_completed(futures), 1):
-                _tally(fut.result(), i)
+            results = pool.map(work, paths, chunksize=max(args.chunksize, 1))
+            for i, r in enumerate(results, 1):
+                _tally(r, i)
 
     wall = time.perf_counter() - t0
     print()
@@ -16,23 +16,20 @@ flagged as breakage.
 
 from __future__ import annotations
 
-import json
 import re
 import sys
 import time
-import urllib3
 from pathlib import Path
 from typing import Any
 
 from judex.sweeps.diff_harness import diff_item
 from judex.scraping.http_session import new_session
 from judex.scraping.scraper import scrape_processo_http
-
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from judex.utils.json_io import read_json
 
 
 def _load_fixture(path: Path) -> dict[str, Any]:
-    return json.load(path.open())
+    return read_json(path)
 
 
 def _split_filename(path: Path) -> tuple[str, int]:
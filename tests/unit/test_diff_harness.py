@@ -0,0 +1,24 @@
+"""Tests for `judex/sweeps/diff_harness.py:diff_item`."""
+
+from __future__ import annotations
+
+from judex.sweeps.diff_harness import diff_item
+
+
+def test_skip_fields_never_diff_and_keys_come_out_sorted():
+    http = {"_meta": {"a": 1}, "relator": "X", "classe": "HC"}
+    gt = {"_meta": {"a": 2}, "relator": "Y", "classe": "RE", "outcome": "z"}
+    msgs = diff_item(http, gt)
+    assert [m.split(":")[0].strip() for m in msgs] == ["classe", "relator"]
+
+
+def test_growing_list_reports_drift_not_regression():
+    http = {"andamentos": [3, 2, 1]}
+    gt = {"andamentos": [2, 1]}
+    assert diff_item(http, gt, allow_growth=True) == [
+        "  andamentos: +1 new item(s) since ground truth "
+        "(expected drift, not a regression)"
+    ]
+    assert diff_item(http, gt) == [
+        "  andamentos: http=[3, 2, 1] vs other=[2, 1]"
+    ]
@@ -157,6 +157,26 @@ def test_non_document_body_recorded_as_failure_not_cached(tmp_path: Path) -> Non
     assert peca_cache.has_bytes("https://x.test/html.pdf") is False
 
 
+def test_oversized_body_recorded_terminal_and_not_replayed(tmp_path: Path) -> None:
+    from judex.scraping.http_session import ResponseTooLargeError
+    from judex.sweeps.peca_store import urls_for_replay
+
+    url = "https://x.test/huge.pdf"
+
+    def getter(session, target, config):
+        raise ResponseTooLargeError(config.peca_max_bytes, target.url)
+
+    _, _, failed = run_download_sweep(
+        [_target(url)], **_kwargs(tmp_path / "sweep", getter=getter),
+    )
+
+    assert failed == 1
+    snap = PecaStore(tmp_path / "sweep").snapshot()[url]
+    assert snap["status"] == "oversized_response"
+    errors_path = tmp_path / "sweep" / "pdfs.errors.jsonl"
+    assert urls_for_replay(errors_path, stage="baixar") == []
+
+
 def test_http_error_classified_and_recorded(tmp_path: Path) -> None:
     def getter(session, target, config):
         raise RuntimeError("network nope")
@@ -102,6 +102,10 @@ def test_classify_varrer_unified_pipeline(row: dict, expected: str) -> None:
     # Transient: body had unexpected magic bytes (HTML soft-error page).
     ({"status": "non_document_response", "error": "expected PDF magic, got HTML"},
      "transient"),
+    # Terminal: body past `peca_max_bytes` — same size on every replay.
+    ({"status": "oversized_response",
+      "error": "body exceeds 209,715,200 bytes https://sistemas.stf.jus.br/x"},
+     "terminal"),
     # Terminal: real 404, the peça is gone from STF — observed in HC
     # 2025 baixar (6 rows) and HC 2026 baixar (10 rows).
     ({"status": "http_error",
@@ -148,6 +152,9 @@ def test_classify_baixar(row: dict, expected: str) -> None:
     ({"status": "http_error",
       "error": "ChunkedEncodingError: ('Connection broken: IncompleteRead(15563 bytes read, 12345 more expected)',)"},
      "transient"),
+    ({"status": "oversized",
+      "error": "body exceeds 209,715,200 bytes https://sistemas.stf.jus.br/x"},
+     "terminal"),
 ])
 def test_classify_baixar_unified_pipeline(row: dict, expected: str) -> None:
     """Same unified-pipeline-parity contract as varrer — pin the new
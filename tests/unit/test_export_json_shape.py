@@ -41,3 +41,55 @@ def test_save_overwrites_instead_of_appending(tmp_path: Path):
     raw = json.loads((tmp_path / "judex-mini_HC_1.json").read_text())
     assert isinstance(raw, dict)
     assert raw["processo_id"] == 2
+
+
+def test_export_items_appends_batch_to_csv_and_jsonl(tmp_path: Path):
+    from judex.data.export import export_items
+    from judex.data.output import OutputConfig
+
+    out = str(tmp_path / "judex-mini_HC_1-3")
+    config = OutputConfig(csv=True, jsonl=True, json=False)
+    first = [_minimal_item(1), _minimal_item(2)]
+    export_items(first, out, str(tmp_path), config)  # type: ignore[arg-type]
+    export_items([_minimal_item(3)], out, str(tmp_path), config)  # type: ignore[list-item]
+
+    csv_lines = (tmp_path / "judex-mini_HC_1-3.csv").read_text().splitlines()
+    assert len(csv_lines) == 4  # one header + three rows
+    jsonl = (tmp_path / "judex-mini_HC_1-3.jsonl").read_text().splitlines()
+    assert [json.loads(line)["processo_id"] for line in jsonl] == [1, 2, 3]
+
+
+def test_export_items_never_truncates_after_handle_overwrite(tmp_path: Path):
+    from judex.data.export import export_items, handle_overwrite
+    from judex.data.output import OutputConfig
+
+    out = str(tmp_path / "judex-mini_HC_1-2")
+    config = OutputConfig(csv=True, jsonl=True, json=False)
+    export_items([_minimal_item(9)], out, str(tmp_path), config)  # type: ignore[list-item]
+
+    handle_overwrite(True, config, out)
+    export_items([_minimal_item(1)], out, str(tmp_path), config)  # type: ignore[list-item]
+    export_items([_minimal_item(2)], out, str(tmp_path), config)  # type: ignore[list-item]
+
+    jsonl = (tmp_path / "judex-mini_HC_1-2.jsonl").read_text().splitlines()
+    assert [json.loads(line)["processo_id"] for line in jsonl] == [1, 2]
+    csv_lines = (tmp_path / "judex-mini_HC_1-2.csv").read_text().splitlines()
+    assert len(csv_lines) == 3  # one header + both batches
+
+
+def test_export_items_jsonl_keeps_nested_values_and_accents(tmp_path: Path):
+    from judex.data.export import export_items
+    from judex.data.output import OutputConfig
+
+    item = {
+        **_minimal_item(7),
+        "relator": "MIN. CÁRMEN LÚCIA",
+        "partes": [{"tipo": "PACTE"}],
+    }
+    out = str(tmp_path / "judex-mini_HC_7-7")
+    config = OutputConfig(csv=False, jsonl=True, json=False)
+    export_items([item], out, str(tmp_path), config)  # type: ignore[list-item]
+
+    line = (tmp_path / "judex-mini_HC_7-7.jsonl").read_text(encoding="utf-8")
+    assert "CÁRMEN" in line
+    assert json.loads(line) == item
@@ -46,3 +46,20 @@ def test_extract_badges_drops_primary_and_success_even_when_unique():
 
 def test_extract_badges_empty_when_no_badges():
     assert extract_badges(_soup("<p>no badges here</p>")) == []
+
+
+def test_meio_and_publicidade_classify_the_shared_badge_texts():
+    from judex.scraping.extraction.detalhe import extract_badge_texts
+    from judex.scraping.extraction.meio import extract_meio
+    from judex.scraping.extraction.publicidade import extract_publicidade
+
+    texts = extract_badge_texts(_soup("""
+        <span class="badge bg-primary">Processo Eletrônico</span>
+        <span class="badge bg-success">Público</span>
+        <span class="badge bg-danger">Criminal</span>
+    """))
+    assert texts == ["Processo Eletrônico", "Público", "Criminal"]
+    assert extract_meio(texts) == "ELETRONICO"
+    assert extract_publicidade(texts) == "PUBLICO"
+    assert extract_publicidade(["Processo Físico", "Sigiloso"]) == "SIGILOSO"
+    assert extract_meio([]) is None
@@ -352,3 +352,23 @@ def test_pick_provider_routes_acordao_to_tesseract_else_pypdf() -> None:
     assert pick_provider("MANIFESTAÇÃO DA PGR")      == "pypdf"
     assert pick_provider("Voto")                     == "pypdf"
     assert pick_provider(None)                       == "pypdf"
+
+
+def test_identical_bytes_under_two_urls_dispatch_once(tmp_path: Path) -> None:
+    """Same PDF bytes behind two URLs → one provider call, both cached."""
+    for url in ("https://x.test/a.pdf", "https://x.test/b.pdf"):
+        peca_cache.write_bytes(url, b"%PDF-1.4 same bytes")
+
+    calls: list[bytes] = []
+    def dispatcher(body, cfg):
+        calls.append(body)
+        return ExtractResult(text="shared text", provider="mistral")
+
+    extracted, cached, no_bytes, failed = run_extract_sweep(
+        [_target("https://x.test/a.pdf"), _target("https://x.test/b.pdf")],
+        **_kwargs(tmp_path / "sweep", dispatcher=dispatcher),
+    )
+
+    assert len(calls) == 1
+    assert (extracted, cached, no_bytes, failed) == (2, 0, 0, 0)
+    assert peca_cache.read("https://x.test/b.pdf") == "shared text"
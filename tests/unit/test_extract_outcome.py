@@ -259,3 +259,19 @@ def test_andamento_source_uses_data_as_date_iso():
     out = derive_outcome(item)
     assert out is not None
     assert out["date_iso"] == "2021-06-01"
+
+
+def test_verdict_pattern_sources_are_lowercase():
+    # `_match_verdict` lowers the text and drops re.I; an uppercase
+    # letter in a pattern source would silently never match.
+    from judex.analysis.legal_vocab import VERDICT_PATTERNS
+
+    for pattern, label in VERDICT_PATTERNS:
+        assert pattern.pattern == pattern.pattern.lower(), label
+
+
+def test_uppercase_text_still_matches():
+    item = _make_item(sessao_virtual=[
+        {"voto_relator": "DENEGO A ORDEM DE HABEAS CORPUS.", "metadata": {}},
+    ])
+    assert _verdict(item) == "denegado"
@@ -0,0 +1,48 @@
+"""Tests for the `.processo-dados` label map and its two readers."""
+
+from __future__ import annotations
+
+from bs4 import BeautifulSoup
+
+from judex.scraping.extraction._shared import processo_dados
+from judex.scraping.extraction.classe import extract_classe
+from judex.scraping.extraction.relator import extract_relator
+
+
+def _soup(inner: str) -> BeautifulSoup:
+    return BeautifulSoup(f"<html><body>{inner}</body></html>", "lxml")
+
+
+_DETALHE = """
+    <div class="processo-dados">Classe: <strong>HC</strong></div>
+    <div class="processo-dados">Relator(a): <strong>MIN.  CÁRMEN LÚCIA</strong></div>
+    <div class="processo-dados">Redator do acórdão:</div>
+    <div class="processo-dados">sem rótulo</div>
+"""
+
+
+def test_processo_dados_maps_label_to_value_and_skips_unlabeled_rows():
+    assert processo_dados(_soup(_DETALHE)) == {
+        "Classe": "HC",
+        "Relator(a)": "MIN.  CÁRMEN LÚCIA",
+        "Redator do acórdão": "",
+    }
+
+
+def test_processo_dados_first_row_wins_on_repeated_label():
+    html = (
+        '<div class="processo-dados">Classe: HC</div>'
+        '<div class="processo-dados">Classe: RE</div>'
+    )
+    assert processo_dados(_soup(html))["Classe"] == "HC"
+
+
+def test_extract_classe_and_relator_read_from_the_map():
+    soup = _soup(_DETALHE)
+    assert extract_classe(soup) == "HC"
+    assert extract_relator(soup) == "CÁRMEN LÚCIA"
+
+
+def test_extract_relator_empty_value_is_none():
+    assert extract_relator(_soup('<div class="processo-dados">Relator(a):</div>')) is None
+    assert extract_relator(_soup("")) is None
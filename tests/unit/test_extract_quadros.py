@@ -0,0 +1,31 @@
+"""Tests for `extract_quadros` on the abaInformacoes fragment."""
+
+from __future__ import annotations
+
+from bs4 import BeautifulSoup
+
+from judex.scraping.extraction.info import extract_quadros
+
+
+def _box(rotulo: str, numero: str | None) -> str:
+    num = f'<div class="numero">{numero}</div>' if numero is not None else ""
+    return f'<div class="processo-quadro">{num}<div class="rotulo">{rotulo}</div></div>'
+
+
+def _soup(*boxes: str) -> BeautifulSoup:
+    return BeautifulSoup(f"<html><body>{''.join(boxes)}</body></html>", "lxml")
+
+
+def test_reads_all_three_counters():
+    soup = _soup(_box("Volumes", "2"), _box("Folhas", "118"), _box("Apensos", "0"))
+    assert extract_quadros(soup) == {"volumes": 2, "folhas": 118, "apensos": 0}
+
+
+def test_missing_or_non_numeric_counters_are_none():
+    soup = _soup(_box("Volumes", None), _box("Folhas", "—"))
+    assert extract_quadros(soup) == {"volumes": None, "folhas": None, "apensos": None}
+
+
+def test_first_matching_box_wins():
+    soup = _soup(_box("Folhas", "7"), _box("Folhas", "9"))
+    assert extract_quadros(soup)["folhas"] == 7
@@ -41,6 +41,16 @@ def test_write_case_round_trips_all_tabs(tmp_path, monkeypatch) -> None:
     assert html_cache.read_incidente("HC", 42) == 98765
 
 
+def test_read_case_returns_incidente_and_every_tab(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(html_cache, "CACHE_ROOT", tmp_path)
+
+    tabs = {"detalhe": "<html>d</html>", "sessao_oi_1": "[]"}
+    html_cache.write_case("HC", 42, tabs=tabs, incidente=98765)
+
+    assert html_cache.read_case("HC", 42) == (98765, tabs)
+    assert html_cache.read_case("HC", 43) == (None, {})
+
+
 def test_read_missing_tab_returns_none_when_case_exists(tmp_path, monkeypatch) -> None:
     monkeypatch.setattr(html_cache, "CACHE_ROOT", tmp_path)
 
@@ -39,3 +39,19 @@ def test_importing_main_loads_zero_selenium_modules() -> None:
         f"Importing main pulled in {count} selenium modules — the "
         f"Selenium dispatch should be entirely gone post-2026-04-17."
     )
+
+
+def test_extractors_take_no_driver_argument() -> None:
+    # Every field is read from the fragment soup/HTML already fetched by
+    # the scraper — a `driver` parameter would mean a per-field round-trip
+    # to a browser process crept back in.
+    import inspect
+
+    from judex.scraping.extraction import http as ex
+
+    offenders = [
+        name
+        for name in ex.__all__
+        if "driver" in inspect.signature(getattr(ex, name)).parameters
+    ]
+    assert offenders == []
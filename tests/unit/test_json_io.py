@@ -0,0 +1,33 @@
+"""`read_json` parses the same with and without orjson."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from judex.utils import json_io
+
+
+_DOC = {"classe": "HC", "processo_id": 1, "partes": [{"nome": "JOSÉ"}], "x": None}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_read_json_matches_stdlib(tmp_path: Path, monkeypatch, use_orjson: bool):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_io, "orjson", None)
+    path = tmp_path / "case.json"
+    path.write_text(json.dumps(_DOC, ensure_ascii=False, indent=2), encoding="utf-8")
+    assert json_io.read_json(path) == _DOC
+
+
+def test_read_json_accepts_what_stdlib_accepts(tmp_path: Path):
+    # NaN and >64-bit ints are stdlib-only; orjson's rejection falls back.
+    path = tmp_path / "odd.json"
+    path.write_text('{"a": NaN, "b": 123456789012345678901234567890}')
+    out = json_io.read_json(path)
+    assert out["a"] != out["a"]
+    assert out["b"] == 123456789012345678901234567890
@@ -67,3 +67,36 @@ def test_range_with_bare_dict_doesnt_crash(tmp_path: Path) -> None:
     path.write_text(json.dumps({"processo_id": 11, "classe": "HC"}))
 
     assert sorted(check_missing_processes("HC", 10, 12, str(out_dir), _json_only())) == [10, 12]
+
+
+def test_csv_ids_come_back_sorted(tmp_path: Path) -> None:
+    path = tmp_path / "judex-mini_HC_1-5.csv"
+    path.write_text(
+        'processo_id,partes\n'
+        '4,"[{""nome"": ""X""}]"\n'
+        '2,[]\n'
+        '2,[]\n'
+    )
+    cfg = OutputConfig(csv=True, jsonl=False, json=False)
+    assert check_missing_processes("HC", 1, 5, str(tmp_path), cfg) == [1, 3, 5]
+
+
+def test_jsonl_string_and_int_ids_both_count(tmp_path: Path) -> None:
+    path = tmp_path / "judex-mini_HC_7-9.jsonl"
+    path.write_text('{"processo_id": 7}\n{"processo_id": "9"}\n')
+    cfg = OutputConfig(csv=False, jsonl=True, json=False)
+    assert check_missing_processes("HC", 7, 9, str(tmp_path), cfg) == [8]
+
+
+def test_csv_without_id_column_is_empty(tmp_path: Path) -> None:
+    (tmp_path / "judex-mini_HC_1-2.csv").write_text("classe\nHC\n")
+    cfg = OutputConfig(csv=True, jsonl=False, json=False)
+    assert check_missing_processes("HC", 1, 2, str(tmp_path), cfg) == []
+
+
+def test_csv_quoted_newlines_in_list_columns(tmp_path: Path) -> None:
+    (tmp_path / "judex-mini_HC_1-3.csv").write_text(
+        'partes,processo_id\n"[""a\nb""]",3\n[],1\n'
+    )
+    cfg = OutputConfig(csv=True, jsonl=False, json=False)
+    assert check_missing_processes("HC", 1, 3, str(tmp_path), cfg) == [2]
@@ -0,0 +1,47 @@
+"""Behavior tests for the PyMuPDF text-layer provider."""
+
+from __future__ import annotations
+
+import pytest
+
+from judex.scraping.ocr import OCRConfig, extract_pdf
+
+pymupdf = pytest.importorskip("pymupdf")
+
+
+def _pdf(*pages: str) -> bytes:
+    doc = pymupdf.open()
+    for text in pages:
+        page = doc.new_page()
+        if text:
+            page.insert_text((72, 72), text)
+    return doc.tobytes()
+
+
+def test_extract_joins_pages_and_labels_provider() -> None:
+    cfg = OCRConfig(provider="pymupdf", api_key="")
+
+    out = extract_pdf(_pdf("Page one.", "Page two."), config=cfg)
+
+    assert [t.strip() for t in out.text.splitlines() if t.strip()] == [
+        "Page one.",
+        "Page two.",
+    ]
+    assert out.elements is None
+    assert out.pages_processed == 2
+    assert out.provider == "pymupdf"
+
+
+def test_extract_blank_pages_returns_empty_text() -> None:
+    cfg = OCRConfig(provider="pymupdf", api_key="")
+
+    out = extract_pdf(_pdf("", ""), config=cfg)
+
+    assert out.text == ""
+    assert out.pages_processed == 2
+
+
+def test_wall_undercuts_pypdf() -> None:
+    from judex.scraping.ocr.dispatch import estimate_wall
+
+    assert 0 < estimate_wall("pymupdf", 10) < estimate_wall("pypdf", 10)
@@ -34,3 +34,11 @@ def test_detect_file_type_recognizes_rtf_magic():
         content = _MINIMAL_STF_RTF
 
     assert detect_file_type(_FakeResp()) == "rtf"
+
+
+def test_embedded_picture_payload_does_not_change_text():
+    blob = b"\r\n".join([b"89504e470d0a1a0a" * 8] * 64)
+    with_pict = _MINIMAL_STF_RTF.replace(
+        b"\\pard", b"{\\pict\\pngblip\\picw100\\pich100\r\n" + blob + b"\r\n}\\pard", 1
+    )
+    assert extract_rtf_text(with_pict) == extract_rtf_text(_MINIMAL_STF_RTF)
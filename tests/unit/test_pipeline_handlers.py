@@ -436,3 +436,33 @@ def test_handle_extract_text_auto_falls_back_to_pypdf_when_doc_type_missing(
     handlers["extract_text"](task)
 
     assert captured[0].provider == "pypdf"
+
+
+def test_handle_fetch_bytes_records_oversized_body_as_terminal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A peça past ``peca_max_bytes`` lands as ``oversized``, not
+    ``http_error`` — the latter is retryable, so errors.jsonl would
+    replay the same oversized link on every ``--retentar-de`` pass."""
+    from judex.pipeline.recovery_policy import is_retryable_status
+    from judex.scraping import http_session
+    from judex.utils import peca_cache
+
+    state = PipelineState.load(tmp_path / "s.json")
+    url = "https://sistemas.stf.jus.br/huge.pdf"
+
+    def _too_large(_session, u, *, max_bytes, **_k):
+        raise http_session.ResponseTooLargeError(max_bytes, u)
+
+    monkeypatch.setattr(peca_cache, "has_bytes", lambda _u: False)
+    monkeypatch.setattr(http_session, "_http_get_bytes_with_retry", _too_large)
+
+    handlers = make_handlers(state, provedor="pypdf", source_dir=tmp_path)
+    task = Task(
+        kind="fetch_bytes", pool="sistemas", case_key=("HC", 1),
+        payload={"url": url, "doc_type": "DECISÃO MONOCRÁTICA"},
+    )
+
+    assert handlers["fetch_bytes"](task) == []
+    assert state.bytes_status(("HC", 1), url=url) == "oversized"
+    assert not is_retryable_status("fetch_bytes", "oversized")
@@ -43,10 +43,14 @@ def _write_required(classe: str, processo: int) -> None:
 
 # ----- `_read_all_cached` required/optional split --------------------------
 
+def _cached(classe: str, processo: int) -> dict[str, str]:
+    return html_cache.read_case(classe, processo)[1]
+
+
 def test_read_all_cached_tolerates_missing_pautas(iso_cache):
     _write_required("HC", 1)
     # No abaPautas / abaDecisoes / abaRecursos / abaPeticoes / abaDeslocamentos.
-    tabs = rc._read_all_cached("HC", 1)
+    tabs = rc._read_all_cached(_cached("HC", 1))
     assert tabs is not None
     assert tabs[rc.TAB_PAUTAS] == ""
     assert tabs[rc.TAB_DECISOES] == ""
@@ -70,7 +74,7 @@ def test_read_all_cached_preserves_existing_optional_tabs(iso_cache):
         },
         incidente=999,
     )
-    tabs = rc._read_all_cached("HC", 2)
+    tabs = rc._read_all_cached(_cached("HC", 2))
     assert tabs is not None
     assert tabs[rc.TAB_PAUTAS] == "<html>pautas real</html>"
 
@@ -89,8 +93,8 @@ def test_read_all_cached_returns_none_when_required_tab_missing(
     }
     del tabs[missing_tab]
     html_cache.write_case("HC", 3, tabs=tabs, incidente=999)
-    assert rc._read_all_cached("HC", 3) is None
+    assert rc._read_all_cached(_cached("HC", 3)) is None
 
 
 def test_read_all_cached_returns_none_when_archive_absent(iso_cache):
-    assert rc._read_all_cached("HC", 404) is None
+    assert rc._read_all_cached(_cached("HC", 404)) is None
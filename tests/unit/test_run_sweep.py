@@ -14,6 +14,8 @@ from unittest.mock import Mock
 import requests
 
 from judex.sweeps.run_sweep import (
+    index_gt_dir,
+    load_gt_fixture,
     parse_selenium_row,
     parse_sweep_csv,
 )
@@ -250,3 +252,30 @@ def test_parse_selenium_row_numero_origem_list():
     }
     parsed = parse_selenium_row(row)
     assert parsed["numero_origem"] == [123, 456]
+
+
+def test_load_gt_fixture_prefers_exact_then_suffixed(tmp_path):
+    (tmp_path / "ADI_2820_reread.json").write_text('{"v": "reread"}')
+    (tmp_path / "HC_1_old.json").write_text('{"v": "old"}')
+    (tmp_path / "HC_1.json").write_text('{"v": "exact"}')
+    (tmp_path / "notes.json").write_text("{}")
+
+    index = index_gt_dir(tmp_path)
+    assert load_gt_fixture(index, "HC", 1) == {"v": "exact"}
+    assert load_gt_fixture(index, "ADI", 2820) == {"v": "reread"}
+    assert load_gt_fixture(index, "ADI", 1) is None
+
+
+def test_gt_index_keys_on_the_filename_digits(tmp_path):
+    (tmp_path / "HC_01.json").write_text('{"v": "padded"}')
+    (tmp_path / "HC_007_x.json").write_text('{"v": "padded-suffixed"}')
+
+    index = index_gt_dir(tmp_path)
+    assert load_gt_fixture(index, "HC", 1) is None
+    assert load_gt_fixture(index, "HC", 7) is None
+
+
+def test_gt_index_is_rebuilt_per_call(tmp_path):
+    assert load_gt_fixture(index_gt_dir(tmp_path), "HC", 5) is None
+    (tmp_path / "HC_5.json").write_text('{"v": "late"}')
+    assert load_gt_fixture(index_gt_dir(tmp_path), "HC", 5) == {"v": "late"}
@@ -5,6 +5,8 @@ These tests pin down the tenacity wrapper around network GETs:
 eventually gives up after max_attempts.
 """
 
+import io
+import re
 from unittest.mock import Mock
 
 import pytest
@@ -202,3 +204,250 @@ def test_resolve_incidente_returns_int_on_match(fast_config: ScraperConfig) -> N
     session.get = Mock(return_value=redirect)
 
     assert resolve_incidente(session, "HC", 1, config=fast_config) == 123456
+
+
+def test_run_scraper_http_retries_from_memory_between_two_scans(
+    fast_config: ScraperConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    import judex.data.export as export_mod
+    import judex.data.missing as missing_mod
+    from judex.scraping import scraper_batch
+
+    attempts: dict[int, int] = {}
+
+    def fake_scrape(classe, processo, **_kwargs):
+        attempts[processo] = attempts.get(processo, 0) + 1
+        # 2 fails on its first two tries, then succeeds.
+        if processo == 2 and attempts[processo] <= 2:
+            raise RuntimeError("transient")
+        return {"processo_id": processo}
+
+    scans: list[int] = []
+
+    def fake_check_missing(*_args, **_kwargs):
+        scans.append(1)
+        return [2]
+
+    monkeypatch.setattr(scraper_batch, "scrape_processo_http", fake_scrape)
+    monkeypatch.setattr(missing_mod, "check_missing_processes", fake_check_missing)
+    monkeypatch.setattr(
+        export_mod, "export_items", lambda items, *_a: [f"f{i['processo_id']}" for i in items]
+    )
+
+    scraper_batch.run_scraper_http(
+        "HC", 1, 3, "json", str(tmp_path), True, fast_config, fetch_dje=False,
+    )
+
+    assert attempts == {1: 1, 2: 3, 3: 1}
+    # Cold scan before the retries, closing scan after them; the fake
+    # export wrote nothing, so the closing scan still reports 2 missing.
+    assert len(scans) == 2
+    assert "1 processos still missing from output: [2]" in caplog.text
+
+
+def test_run_scraper_http_process_workers_export_every_item_once(
+    fast_config: ScraperConfig, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    import threading
+
+    import judex.data.export as export_mod
+    import judex.data.missing as missing_mod
+    from judex.scraping import scraper_batch
+
+    main = threading.get_ident()
+    exported: list[int] = []
+
+    def fake_export(items, *_a):
+        # Exports must stay on the caller's thread.
+        assert threading.get_ident() == main
+        exported.extend(item["processo_id"] for item in items)
+        return []
+
+    monkeypatch.setattr(
+        scraper_batch, "scrape_processo_http", lambda c, p, **_k: {"processo_id": p}
+    )
+    monkeypatch.setattr(missing_mod, "check_missing_processes", lambda *_a: [])
+    monkeypatch.setattr(export_mod, "export_items", fake_export)
+
+    fast_config.process_workers = 4
+    scraper_batch.run_scraper_http(
+        "HC", 1, 20, "json", str(tmp_path), True, fast_config, fetch_dje=False,
+    )
+    assert sorted(exported) == list(range(1, 21))
+
+
+def test_run_scraper_http_overwrite_keeps_every_pass_on_disk(
+    fast_config: ScraperConfig, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    import json
+
+    from judex.scraping import scraper_batch
+
+    attempts: dict[int, int] = {}
+
+    def fake_scrape(classe, processo, **_kwargs):
+        attempts[processo] = attempts.get(processo, 0) + 1
+        # 2 lands in the retry pass, i.e. a second export into the same file.
+        if processo == 2 and attempts[processo] == 1:
+            raise RuntimeError("transient")
+        return {"classe": classe, "processo_id": processo}
+
+    monkeypatch.setattr(scraper_batch, "scrape_processo_http", fake_scrape)
+
+    out = tmp_path / "judex-mini_HC_1-3.jsonl"
+    out.write_text(json.dumps({"processo_id": 99}) + "\n")  # stale prior run
+
+    scraper_batch.run_scraper_http(
+        "HC", 1, 3, "jsonl", str(tmp_path), True, fast_config, fetch_dje=False,
+    )
+
+    ids = [json.loads(line)["processo_id"] for line in out.read_text().splitlines()]
+    assert sorted(ids) == [1, 2, 3]
+
+
+def test_scrape_processo_http_opens_one_session_when_none_given(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from judex.scraping import scraper
+
+    opened: list[Mock] = []
+
+    def fake_new_session(*_a, **_k):
+        s = Mock()
+        s.__enter__ = Mock(return_value=s)
+        s.__exit__ = Mock(return_value=False)
+        opened.append(s)
+        return s
+
+    seen: list[object] = []
+
+    def fake_fetch_process(classe, processo, *, session, **_k):
+        seen.append(session)
+        return scraper.ProcessFetch(incidente=1, detalhe_html="", tabs={})
+
+    def fake_sessao(*, fetcher, **_k):
+        return []
+
+    monkeypatch.setattr(scraper, "new_session", fake_new_session)
+    monkeypatch.setattr(scraper, "fetch_process", fake_fetch_process)
+    monkeypatch.setattr(
+        scraper.sessao_ex, "extract_sessao_virtual_from_json", fake_sessao
+    )
+
+    item = scraper.scrape_processo_http("HC", 1, fetch_dje=False)
+
+    assert item["incidente"] == 1
+    assert len(opened) == 1
+    assert seen == [opened[0]]
+    opened[0].__exit__.assert_called_once()
+
+
+def test_retry_policy_is_built_once_per_config(fast_config: ScraperConfig) -> None:
+    session = Mock()
+    session.get = Mock(return_value=_fake_response(200, "ok"))
+    scraper_http._retry_policy.cache_clear()
+
+    for _ in range(3):
+        scraper_http._http_get_with_retry(
+            session, "https://example.test/x", config=fast_config
+        )
+    assert scraper_http._retry_policy.cache_info().misses == 1
+
+
+def test_new_session_pools_enough_connections_for_tab_workers() -> None:
+    with scraper_http.new_session() as s:
+        adapter = s.get_adapter("https://portal.stf.jus.br/processos/")
+        assert adapter._pool_maxsize == scraper_http._POOL_MAXSIZE
+        assert adapter.max_retries.total == 0
+
+
+def _streamed_response(body: bytes, content_length: str | None = None) -> requests.Response:
+    r = requests.Response()
+    r.status_code = 200
+    r.raw = io.BytesIO(body)
+    if content_length is not None:
+        r.headers["Content-Length"] = content_length
+    return r
+
+
+def test_http_get_bytes_streams_body_under_the_cap(
+    fast_config: ScraperConfig,
+) -> None:
+    session = Mock()
+    session.get = Mock(return_value=_streamed_response(b"%PDF" + b"x" * 100))
+
+    body = scraper_http._http_get_bytes_with_retry(
+        session, "http://x.test/doc.pdf", max_bytes=1000, config=fast_config,
+    )
+
+    assert body == b"%PDF" + b"x" * 100
+    assert session.get.call_args.kwargs["stream"] is True
+
+
+@pytest.mark.parametrize("content_length", ["5000", None])
+def test_http_get_bytes_rejects_oversized_body_without_retry(
+    fast_config: ScraperConfig, content_length: str | None,
+) -> None:
+    # Declared length over the cap aborts up front; an undeclared one is
+    # cut off mid-stream. Either way the GET is not retried.
+    session = Mock()
+    session.get = Mock(return_value=_streamed_response(b"x" * 200_000, content_length))
+
+    with pytest.raises(scraper_http.ResponseTooLargeError):
+        scraper_http._http_get_bytes_with_retry(
+            session, "http://x.test/huge.pdf", max_bytes=1000, config=fast_config,
+        )
+    assert session.get.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "host, silenced",
+    [
+        ("portal.stf.jus.br", True),
+        ("stf.jus.br", True),
+        ("api.mistral.ai", False),
+        ("stf.jus.br.evil.com", False),
+    ],
+)
+def test_insecure_request_warning_silenced_for_stf_hosts_only(
+    host: str, silenced: bool
+) -> None:
+    # Same match `warnings.filterwarnings` applies to the message.
+    msg = f"Unverified HTTPS request is being made to host '{host}'. Adding ..."
+    pattern = re.compile(scraper_http._STF_UNVERIFIED_WARNING, re.I)
+    assert bool(pattern.match(msg)) is silenced
+
+
+def test_run_scraper_http_interrupt_stops_queue_and_exports_finished(
+    fast_config: ScraperConfig, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    import judex.data.export as export_mod
+    import judex.data.missing as missing_mod
+    from judex.scraping import scraper_batch
+
+    scraped: list[int] = []
+    exported: list[int] = []
+
+    def fake_scrape(classe, processo, **_kwargs):
+        if processo == 3:
+            raise KeyboardInterrupt
+        scraped.append(processo)
+        return {"processo_id": processo}
+
+    monkeypatch.setattr(scraper_batch, "scrape_processo_http", fake_scrape)
+    monkeypatch.setattr(missing_mod, "check_missing_processes", lambda *_a: [])
+    monkeypatch.setattr(
+        export_mod,
+        "export_items",
+        lambda items, *_a: exported.extend(i["processo_id"] for i in items) or [],
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        scraper_batch.run_scraper_http(
+            "HC", 1, 60, "json", str(tmp_path), True, fast_config, fetch_dje=False,
+        )
+    assert scraped == [1, 2]
+    assert exported == [1, 2]
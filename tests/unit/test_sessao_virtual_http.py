@@ -13,6 +13,7 @@ import json
 from pathlib import Path
 
 from judex.scraping.extraction.sessao import (
+    _strip_html,
     extract_sessao_virtual_from_json,
     parse_oi_listing,
     parse_sessao_virtual,
@@ -101,6 +102,14 @@ def test_parse_sessao_virtual_strips_html_from_voto_relator() -> None:
     assert entries[0]["voto_relator"] == "Nega agravo regimental do MPF."
 
 
+def test_strip_html_plain_text_matches_parsed_path() -> None:
+    # Plain cabecalhos skip the BeautifulSoup parse; output must not change.
+    raw = "  Nega agravo\n regimental\xa0 do MPF.  "
+    assert _strip_html(raw) == "Nega agravo regimental do MPF."
+    assert _strip_html(raw) == _strip_html(f"<p>{raw}</p>")
+    assert _strip_html("") == ""
+
+
 def test_parse_sessao_virtual_second_entry_has_voto_vista() -> None:
     """The second session had a vista ministro who later voted — Voto Vista
     should appear in documentos (v4 list shape)."""
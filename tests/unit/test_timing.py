@@ -0,0 +1,59 @@
+"""Tests for `judex/utils/timing.py`."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from judex.utils.timing import track_extraction_timing
+
+
+def _extractor(x: int) -> int:
+    return x + 1
+
+
+def test_track_extraction_timing_is_identity_without_profile(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("JUDEX_PROFILE", raising=False)
+    assert track_extraction_timing(_extractor) is _extractor
+
+
+def test_track_extraction_timing_wraps_and_logs_with_profile(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setenv("JUDEX_PROFILE", "1")
+    wrapped = track_extraction_timing(_extractor)
+    assert wrapped is not _extractor
+    assert wrapped.__name__ == "_extractor"
+    with caplog.at_level(logging.DEBUG):
+        assert wrapped(1) == 2
+    assert "_extractor" in caplog.text
+
+
+def test_process_timer_summary_stats_over_successful_runs(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    from judex.utils.timing import ProcessTimer
+
+    timer = ProcessTimer()
+    runs = [("HC 1", 2.0, True), ("HC 2", 9.0, False), ("HC 3", 4.0, True)]
+    for name, duration, ok in runs:
+        start = timer.start_process(name) - int(duration * 1e9)
+        timer.end_process(name, start, success=ok)
+
+    with caplog.at_level(logging.INFO):
+        timer.log_summary()
+    assert "Tempo médio por processo: 3.00s" in caplog.text
+    assert "Processo mais rápido: 2.00s" in caplog.text
+    assert "Processo mais lento: 4.00s" in caplog.text
+    assert "Total de processos: 3" in caplog.text
+
+
+def test_process_timer_end_time_overrides_now() -> None:
+    from judex.utils.timing import ProcessTimer
+
+    timer = ProcessTimer()
+    timer.end_process("HC 1", 1_000_000_000, end_time=3_500_000_000)
+    assert list(timer.durations) == [2.5]